@@ -39,6 +39,17 @@ class Settings(BaseSettings):
     MONGO_PASSWORD: Optional[str] = os.getenv("MONGO_PASSWORD")
     MONGO_CLUSTER_URL: Optional[str] = os.getenv("MONGO_CLUSTER_URL")
     MONGO_APP_NAME: Optional[str] = os.getenv("MONGO_APP_NAME")
+    # MongoDB connection pool (one client is shared by all OCR/embedding workers)
+    MONGO_MAX_POOL_SIZE: int = int(os.getenv("MONGO_MAX_POOL_SIZE", 200))
+    MONGO_MIN_POOL_SIZE: int = int(os.getenv("MONGO_MIN_POOL_SIZE", 10))
+    MONGO_MAX_IDLE_TIME_MS: int = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", 300000))
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", 10000))
+    MONGO_WRITE_CONCERN: str = os.getenv("MONGO_WRITE_CONCERN", "majority")
+    MONGO_COMPRESSORS: str = os.getenv("MONGO_COMPRESSORS", "zstd,zlib")
+    
+    # Finished jobs, their documents and chunks are deleted this many days after their
+    # last update (0 disables)
+    OCR_JOB_TTL_DAYS: int = int(os.getenv("OCR_JOB_TTL_DAYS", 30))
     
     # OpenAI Configuration
     OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
@@ -55,9 +66,12 @@ class Settings(BaseSettings):
     RAG_TOP_K: int = int(os.getenv("RAG_TOP_K"))
     RAG_MAX_CONTEXT_CHARS: int = int(os.getenv("RAG_MAX_CONTEXT_CHARS"))
     RAG_MAX_SNIPPET_CHARS: int = int(os.getenv("RAG_MAX_SNIPPET_CHARS"))
+    OPENAI_MAX_REQUESTS_PER_MINUTE: int = int(os.getenv("OPENAI_MAX_REQUESTS_PER_MINUTE", 3500))
+    PINECONE_MAX_QUERIES_PER_SECOND: int = int(os.getenv("PINECONE_MAX_QUERIES_PER_SECOND", 100))
     SUMMARY_FULL_DOCUMENT_MODE: bool = os.getenv("SUMMARY_FULL_DOCUMENT_MODE")
     SUMMARY_MAX_CONTEXT_CHARS: int = int(os.getenv("SUMMARY_MAX_CONTEXT_CHARS"))
     SUMMARY_DOC_MAX_CHUNKS: int = int(os.getenv("SUMMARY_DOC_MAX_CHUNKS"))
+    SUMMARY_DOC_FETCH_PARTITIONS: int = int(os.getenv("SUMMARY_DOC_FETCH_PARTITIONS", 4))
     EMBEDDING_DIMENSION: int = int(os.getenv("EMBEDDING_DIMENSION"))
     
     # API
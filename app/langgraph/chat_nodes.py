@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 from langchain_core.messages.base import BaseMessage
 from pathlib import Path
@@ -18,12 +17,15 @@ from langchain_openai import ChatOpenAI
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 from app.config import settings
+from app.services.http import get_async_http_client
 from app.services.pinecone_service import (
+    Citation,
     PineconeServiceError,
     RetrievedChunk,
     assemble_document_context,
     build_qna_context,
     build_summary_context,
+    document_sort_key,
     fetch_full_document_chunks,
     query_context,
 )
@@ -57,6 +59,7 @@ _openai_llm = ChatOpenAI(
     api_key=_require_setting(settings.OPENAI_API_KEY, "OPENAI_API_KEY"),
     timeout=settings.LLM_TIMEOUT,
     max_retries=settings.LLM_MAX_RETRIES,
+    http_async_client=get_async_http_client(),
 )
 
 _google_api_key = _require_setting(settings.GOOGLE_API_KEY, "GOOGLE_API_KEY")
@@ -120,21 +123,6 @@ def _snapshot_json(snapshot: List[Dict[str, Any]]) -> str:
     return json.dumps(snapshot, ensure_ascii=False, indent=2)
 
 
-def _safe_int(value: Any, default: int = 0) -> int:
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return default
-
-
-def _document_sort_key(chunk: RetrievedChunk) -> tuple[int, int]:
-    metadata = chunk.metadata or {}
-    return (
-        _safe_int(metadata.get("page_index"), default=1_000_000),
-        _safe_int(metadata.get("chunk_index"), default=1_000_000),
-    )
-
-
 async def decide_next_step(state: Dict[str, Any]) -> Dict[str, Any]:
     messages: List[BaseMessage] = state.get("messages", []) or []
     user_text = _latest_human_text(messages)
@@ -172,7 +160,7 @@ async def question_answering_agent(state: Dict[str, Any]) -> Dict[str, Any]:
 
     error_message: Optional[str] = None
     retrieved_chunks: List[RetrievedChunk] = []
-    citation_map: List[Dict[str, Any]] = []
+    citation_map: List[Citation] = []
 
     try:
         retrieved_chunks = await query_context(
@@ -180,12 +168,11 @@ async def question_answering_agent(state: Dict[str, Any]) -> Dict[str, Any]:
             top_k=settings.RAG_TOP_K,
             dataset_name=dataset_name,
         )
-        snapshot = _chunk_snapshot(retrieved_chunks)
-        logger.info(
+        logger.opt(lazy=True).info(
             "QnA context retrieved ({} chunks) for dataset '{}':\n{}",
-            len(retrieved_chunks),
-            dataset_name or "default",
-            _snapshot_json(snapshot),
+            lambda: len(retrieved_chunks),
+            lambda: dataset_name or "default",
+            lambda: _snapshot_json(_chunk_snapshot(retrieved_chunks)),
         )
     except PineconeServiceError as exc:
         error_message = str(exc)
@@ -199,14 +186,14 @@ async def question_answering_agent(state: Dict[str, Any]) -> Dict[str, Any]:
         context_text = "Context unavailable or insufficient."
 
     prompt = QNA_PROMPT.format(question=user_question, context=context_text)
-    logger.info(
+    logger.opt(lazy=True).info(
         "QnA prompt constructed:\n{}",
-        _truncate(prompt, 4000),
+        lambda: _truncate(prompt, 4000),
     )
     if citation_map:
-        logger.info(
+        logger.opt(lazy=True).info(
             "QnA citations map:\n{}",
-            json.dumps(citation_map, ensure_ascii=False, indent=2),
+            lambda: json.dumps([citation.as_dict() for citation in citation_map], ensure_ascii=False, indent=2),
         )
 
     try:
@@ -263,12 +250,11 @@ async def summary_generation_agent(state: Dict[str, Any]) -> Dict[str, Any]:
                 top_k=1,
                 dataset_name=dataset_name,
             )
-            initial_snapshot = _chunk_snapshot(initial_chunks, limit=1)
-            logger.info(
+            logger.opt(lazy=True).info(
                 "Summarization top-1 retrieval ({} chunk) for dataset '{}':\n{}",
-                len(initial_chunks),
-                dataset_name or "default",
-                _snapshot_json(initial_snapshot),
+                lambda: len(initial_chunks),
+                lambda: dataset_name or "default",
+                lambda: _snapshot_json(_chunk_snapshot(initial_chunks, limit=1)),
             )
 
             if initial_chunks:
@@ -283,15 +269,14 @@ async def summary_generation_agent(state: Dict[str, Any]) -> Dict[str, Any]:
                     dataset=dataset_name,
                 )
 
-                full_chunks = await asyncio.to_thread(
-                    fetch_full_document_chunks,
+                full_chunks = await fetch_full_document_chunks(
                     document_id=document_id,
                     source_file=source_file,
                     dataset_name=dataset_name,
                 )
 
                 if full_chunks:
-                    context_chunks = sorted(full_chunks, key=_document_sort_key)
+                    context_chunks = sorted(full_chunks, key=document_sort_key)
                     context_chunk_count = len(context_chunks)
                     context_text, truncation_applied = assemble_document_context(
                         context_chunks,
@@ -329,12 +314,11 @@ async def summary_generation_agent(state: Dict[str, Any]) -> Dict[str, Any]:
                     top_k=settings.RAG_TOP_K,
                     dataset_name=dataset_name,
                 )
-                snapshot = _chunk_snapshot(context_chunks)
-                logger.info(
+                logger.opt(lazy=True).info(
                     "Summarization context retrieved ({} chunks) for dataset '{}':\n{}",
-                    len(context_chunks),
-                    dataset_name or "default",
-                    _snapshot_json(snapshot),
+                    lambda: len(context_chunks),
+                    lambda: dataset_name or "default",
+                    lambda: _snapshot_json(_chunk_snapshot(context_chunks)),
                 )
                 context_text = build_summary_context(context_chunks)
                 context_chunk_count = len(context_chunks)
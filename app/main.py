@@ -9,8 +9,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.logger import initialize_logger
 from app.services.gdrive_service import GoogleDriveService
+from app.services.http import close_async_http_client
 from app.services.mongodb_service import MongoDBService
-from app.services.service_manager import set_gdrive_service, set_mongodb_service
+from app.services.pinecone_service import close_async_pinecone_index
+from app.services.service_manager import get_service_registry, set_gdrive_service, set_mongodb_service
 from app.routers import health, upload, ocr, ingestion, chat
 from app.langgraph import build_chat_graph
 
@@ -70,11 +72,14 @@ async def startup_event():
     
     # Initialize MongoDB service
     try:
-        mongodb_service = MongoDBService(
+        mongodb_service = MongoDBService.get_service(
             database_name=settings.MONGODB_DATABASE
         )
         set_mongodb_service(mongodb_service)
-        logger.info("MongoDB service initialized successfully")
+        if mongodb_service.healthcheck():
+            logger.info("MongoDB service initialized successfully")
+        else:
+            logger.warning("MongoDB service initialized but the server is not reachable yet")
     except Exception as e:
         logger.error(f"Failed to initialize MongoDB service: {e}")
         logger.warning("Application started but MongoDB service is unavailable")
@@ -93,9 +98,11 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
-    from app.services.service_manager import mongodb_service
+    mongodb_service = get_service_registry().mongodb
     if mongodb_service:
         mongodb_service.close()
+    await close_async_pinecone_index()
+    await close_async_http_client()
     logger.info("Application shutting down")
 
 
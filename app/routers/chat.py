@@ -44,6 +44,7 @@ async def chat_endpoint(payload: ChatRequest, request: Request) -> ChatResponse:
     )
 
     context_chunks = result.get("context_chunks", 0)
+    citations = result.get("citations")
 
     answer = result.get("answer")
     response_type = "qna"
@@ -57,7 +58,7 @@ async def chat_endpoint(payload: ChatRequest, request: Request) -> ChatResponse:
             type=response_type,
             answer=answer,
             context_chunks=context_chunks,
-            citations=result.get("citations"),
+            citations=[citation.as_dict() for citation in citations] if citations else None,
         )
         logger.info("Chat response generated", response_type=response_type, context_chunks=context_chunks)
         return response
@@ -1,6 +1,8 @@
 """
 Health and root endpoints router
 """
+import asyncio
+
 from fastapi import APIRouter
 from app.config import settings
 from app.schemas.health import RootResponse, HealthResponse
@@ -21,10 +23,17 @@ async def root():
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
-    from app.services.service_manager import gdrive_service
+    from app.services.service_manager import get_service_registry
+    services = get_service_registry()
+    
+    # The ping only happens here, not on every client construction
+    mongodb_ok = False
+    if services.mongodb:
+        mongodb_ok = await asyncio.to_thread(services.mongodb.healthcheck)
     
     return HealthResponse(
         status="healthy",
-        gdrive_service="available" if gdrive_service else "unavailable"
+        gdrive_service="available" if services.gdrive else "unavailable",
+        mongodb_service="available" if mongodb_ok else "unavailable"
     )
 
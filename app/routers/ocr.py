@@ -122,6 +122,20 @@ async def process_ocr(
     total_chunks_emitted = 0
     total_lang_undetected = 0
     
+    # Create all document records up front in bulk
+    doc_ids = mongodb_service.create_docs_bulk(
+        job_id=job_id,
+        dataset_name=request.dataset_name,
+        docs=[
+            {
+                "source_drive_file_id": file_info['id'],
+                "source_path": file_info['path'],
+                "source_url": f"https://drive.google.com/file/d/{file_info['id']}/view"
+            }
+            for file_info in files
+        ]
+    )
+    
     for file_info in files:
         file_id = file_info['id']
         file_name = file_info['name']
@@ -131,14 +145,8 @@ async def process_ocr(
         # Construct Google Drive public view URL
         source_url = f"https://drive.google.com/file/d/{file_id}/view"
         
-        # Create document record
-        doc_id = mongodb_service.create_doc(
-            job_id=job_id,
-            dataset_name=request.dataset_name,
-            source_drive_file_id=file_id,
-            source_path=file_path,
-            source_url=source_url
-        )
+        # Document record was created in bulk before the loop
+        doc_id = doc_ids[file_id]
         
         # Determine output path (mirror structure under "Optical Character Recognition")
         # Example: dataset_name/subfolder/file.pdf -> Optical Character Recognition/dataset_name/subfolder/file.json
@@ -192,12 +200,13 @@ async def process_ocr(
             )
             if existing_file_id:
                 logger.info(f"Skipping {file_name}: output already exists")
-                mongodb_service.update_doc_status(
+                mongodb_service.update_doc(
                     doc_id,
-                    "skipped",
-                    "Output file already exists"
+                    status="skipped",
+                    message="Output file already exists",
+                    output_drive_file_id=existing_file_id,
+                    output_path=output_path
                 )
-                mongodb_service.update_doc_output(doc_id, existing_file_id, output_path)
                 
                 documents.append(DocumentStatus(
                     source_path=file_path,
@@ -210,7 +219,7 @@ async def process_ocr(
                 files_skipped += 1
                 continue
         
-        mongodb_service.update_doc_status(doc_id, "processing", "Downloading file")
+        mongodb_service.update_doc(doc_id, status="processing", message="Downloading file")
         
         try:
             # Download file
@@ -226,17 +235,17 @@ async def process_ocr(
             
             # Check if document has no chunks (empty or failed)
             if result['chunks_emitted'] == 0:
-                mongodb_service.update_doc_status(
+                mongodb_service.update_doc(
                     doc_id,
-                    "failed",
-                    "No extractable text found"
+                    status="failed",
+                    message="No extractable text found",
+                    counts={
+                        "pages_total": result['total_page_count'],
+                        "pages_without_text": result['pages_without_text'],
+                        "chunks_emitted": 0,
+                        "lang_undetected_count": 1 if result['lang_undetected'] else 0
+                    }
                 )
-                mongodb_service.update_doc_counts(doc_id, {
-                    "pages_total": result['total_page_count'],
-                    "pages_without_text": result['pages_without_text'],
-                    "chunks_emitted": 0,
-                    "lang_undetected_count": 1 if result['lang_undetected'] else 0
-                })
                 mongodb_service.update_job_counters(job_id, {
                     "files_failed": 1,
                     "pages_processed": result['total_page_count'],
@@ -283,15 +292,23 @@ async def process_ocr(
             
             output_drive_file_id = output_file_info['file_id']
             
+            # Persist chunk records in one batched write per document
+            mongodb_service.insert_chunks(doc_id, job_id, json_chunks)
+            
             # Update document record
-            mongodb_service.update_doc_status(doc_id, "ok", "Processed successfully")
-            mongodb_service.update_doc_output(doc_id, output_drive_file_id, output_path)
-            mongodb_service.update_doc_counts(doc_id, {
-                "pages_total": result['total_page_count'],
-                "pages_without_text": result['pages_without_text'],
-                "chunks_emitted": result['chunks_emitted'],
-                "lang_undetected_count": 1 if result['lang_undetected'] else 0
-            })
+            mongodb_service.update_doc(
+                doc_id,
+                status="ok",
+                message="Processed successfully",
+                output_drive_file_id=output_drive_file_id,
+                output_path=output_path,
+                counts={
+                    "pages_total": result['total_page_count'],
+                    "pages_without_text": result['pages_without_text'],
+                    "chunks_emitted": result['chunks_emitted'],
+                    "lang_undetected_count": 1 if result['lang_undetected'] else 0
+                }
+            )
             
             # Update job counters
             mongodb_service.update_job_counters(job_id, {
@@ -322,7 +339,7 @@ async def process_ocr(
         
         except Exception as e:
             logger.error(f"Error processing file {file_name}: {e}")
-            mongodb_service.update_doc_status(doc_id, "failed", str(e))
+            mongodb_service.update_doc(doc_id, status="failed", message=str(e))
             mongodb_service.update_job_counters(job_id, {"files_failed": 1})
             
             documents.append(DocumentStatus(
@@ -0,0 +1,25 @@
+"""
+Shared schema types
+"""
+from typing import Annotated, Any
+
+from bson import ObjectId
+from pydantic import PlainSerializer, PlainValidator, WithJsonSchema
+
+
+def _validate_object_id(value: Any) -> ObjectId:
+    """Accept an ObjectId or its 24-character hex string form"""
+    if isinstance(value, ObjectId):
+        return value
+    if isinstance(value, str) and ObjectId.is_valid(value):
+        return ObjectId(value)
+    raise ValueError(f"Invalid ObjectId: {value!r}")
+
+
+# MongoDB ObjectId kept as-is internally and serialized as a hex string in responses
+PyObjectId = Annotated[
+    ObjectId,
+    PlainValidator(_validate_object_id),
+    PlainSerializer(str, return_type=str),
+    WithJsonSchema({"type": "string", "example": "507f1f77bcf86cd799439011"}),
+]
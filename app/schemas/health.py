@@ -24,12 +24,14 @@ class HealthResponse(BaseModel):
     """Health check response schema"""
     status: str = Field(..., description="Health status")
     gdrive_service: str = Field(..., description="Google Drive service availability")
+    mongodb_service: str = Field("unavailable", description="MongoDB service availability (server ping)")
 
     class Config:
         json_schema_extra = {
             "example": {
                 "status": "healthy",
-                "gdrive_service": "available"
+                "gdrive_service": "available",
+                "mongodb_service": "available"
             }
         }
 
@@ -4,6 +4,8 @@ Ingestion pipeline related schemas
 from typing import Optional, Dict, Any
 from pydantic import BaseModel, Field
 
+from app.schemas.common import PyObjectId
+
 
 class IngestionRequest(BaseModel):
     """Request schema for ingestion pipeline"""
@@ -53,7 +55,7 @@ class IngestionResponse(BaseModel):
     embeddings_stored: int = Field(0, description="Total embeddings stored in Pinecone")
     metadata_extracted: bool = Field(False, description="Whether metadata extraction was successful")
     pinecone_index: str = Field(..., description="Pinecone index name")
-    job_id: Optional[str] = Field(None, description="MongoDB job ID")
+    job_id: Optional[PyObjectId] = Field(None, description="MongoDB job ID")
     message: str = Field(..., description="Status message")
     error: Optional[str] = Field(None, description="Error message if status is error")
 
@@ -4,6 +4,8 @@ OCR related schemas
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
+from app.schemas.common import PyObjectId
+
 
 class OCRProcessRequest(BaseModel):
     """Request schema for OCR processing"""
@@ -77,7 +79,7 @@ class OCRProcessResponse(BaseModel):
     dataset_name: str = Field(..., description="Dataset name")
     input_folder_id: str = Field(..., description="Input folder ID")
     output_folder_id: str = Field(..., description="Output folder ID")
-    job_id: str = Field(..., description="MongoDB job ID")
+    job_id: PyObjectId = Field(..., description="MongoDB job ID")
     files_discovered: int = Field(0, description="Number of files discovered")
     files_processed: int = Field(0, description="Number of files processed successfully")
     files_failed: int = Field(0, description="Number of files that failed")
@@ -2,17 +2,24 @@
 Google Drive service for file uploads
 """
 import os
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
 from googleapiclient.errors import HttpError
 from loguru import logger
 
 
+# Bytes fetched per ranged request when streaming a download to disk
+DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+
+
 class GoogleDriveService:
     """Service for interacting with Google Drive API"""
     
@@ -40,6 +47,9 @@ class GoogleDriveService:
         self.client_config = client_config
         self.token_file = token_file
         self.service = None
+        self.credentials = None
+        # httplib2.Http is not thread-safe; worker threads get their own transport
+        self._thread_local = threading.local()
         self._authenticate()
     
     def _authenticate(self):
@@ -99,6 +109,7 @@ class GoogleDriveService:
         
         # Build the service
         try:
+            self.credentials = creds
             self.service = build('drive', 'v3', credentials=creds)
             logger.info("Google Drive service initialized successfully")
         except Exception as e:
@@ -312,10 +323,21 @@ class GoogleDriveService:
             logger.error(f"Unexpected error while creating/finding folder: {e}")
             raise
     
+    def _get_thread_http(self) -> AuthorizedHttp:
+        """Get an authorized HTTP transport owned by the calling thread"""
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+    
     def download_file(self, file_id: str) -> bytes:
         """
         Download a file from Google Drive
         
+        Safe to call from worker threads (e.g. via asyncio.to_thread): the request
+        is executed on a transport owned by the calling thread.
+        
         Args:
             file_id: Google Drive file ID
             
@@ -328,7 +350,7 @@ class GoogleDriveService:
         try:
             logger.debug(f"Downloading file: {file_id}")
             request = self.service.files().get_media(fileId=file_id)
-            file_content = request.execute()
+            file_content = request.execute(http=self._get_thread_http())
             logger.debug(f"Downloaded file: {file_id} ({len(file_content)} bytes)")
             return file_content
         except HttpError as e:
@@ -338,6 +360,51 @@ class GoogleDriveService:
             logger.error(f"Unexpected error while downloading file: {e}")
             raise
     
+    def download_file_to(
+        self,
+        file_id: str,
+        file_path: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> int:
+        """
+        Download a file from Google Drive to a local path in chunks
+        
+        Unlike download_file, the content is never held in memory as a whole; it is
+        streamed to disk with ranged requests of chunk_size bytes. Safe to call from
+        worker threads.
+        
+        Args:
+            file_id: Google Drive file ID
+            file_path: Local path to write the content to (overwritten)
+            chunk_size: Bytes per ranged request
+            
+        Returns:
+            Number of bytes written
+            
+        Raises:
+            HttpError: If Google Drive API error occurs
+        """
+        try:
+            logger.debug(f"Downloading file: {file_id} to {file_path}")
+            request = self.service.files().get_media(fileId=file_id)
+            request.http = self._get_thread_http()
+            
+            with open(file_path, 'wb') as fh:
+                downloader = MediaIoBaseDownload(fh, request, chunksize=chunk_size)
+                done = False
+                while not done:
+                    _, done = downloader.next_chunk()
+                size = fh.tell()
+            
+            logger.debug(f"Downloaded file: {file_id} ({size} bytes)")
+            return size
+        except HttpError as e:
+            logger.error(f"Google Drive API error while downloading file: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error while downloading file: {e}")
+            raise
+    
     def list_files_in_folder(
         self,
         folder_id: str,
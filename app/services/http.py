@@ -0,0 +1,27 @@
+"""Shared outbound HTTP client for OpenAI requests."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import httpx
+
+from app.config import settings
+
+
+@lru_cache(maxsize=1)
+def get_async_http_client() -> httpx.AsyncClient:
+    """Process-wide async HTTP client (HTTP/2, pooled keep-alive connections)."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        timeout=settings.LLM_TIMEOUT,
+    )
+
+
+async def close_async_http_client() -> None:
+    """Close the shared async HTTP client, if one was created."""
+    if get_async_http_client.cache_info().currsize:
+        client = get_async_http_client()
+        get_async_http_client.cache_clear()
+        await client.aclose()
@@ -1,13 +1,20 @@
 """
 Ingestion service for end-to-end pipeline: OCR, metadata extraction, embedding, and Pinecone storage
 """
+import asyncio
 import json
 import os
+import tempfile
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from loguru import logger
 
+import numpy as np
+import tiktoken
 from openai import OpenAI
-from pinecone import Pinecone, ServerlessSpec
+from pinecone import ServerlessSpec, Vector
+from pinecone.grpc import PineconeGRPC
 
 from app.services.service_manager import get_gdrive_service, get_mongodb_service
 from app.services.gdrive_service import GoogleDriveService
@@ -16,6 +23,105 @@ from app.services.mongodb_service import MongoDBService
 from app.config import settings
 
 
+EMBEDDING_MODEL = "text-embedding-3-small"
+# text-embedding-3-small accepts up to 8192 input tokens; keep some headroom
+EMBEDDING_MAX_TOKENS = 8000
+
+# Inputs per embeddings request; the character cap keeps a batch well under the
+# API's per-request token limit even for scripts that tokenize densely
+EMBEDDING_BATCH_SIZE = 256
+EMBEDDING_BATCH_MAX_CHARS = 100_000
+
+# Vectors per gRPC upsert request
+PINECONE_UPSERT_BATCH_SIZE = 100
+
+# Characters of OCR text sent to GPT for metadata extraction
+METADATA_TEXT_MAX_CHARS = 15000
+
+def _remove_temp_file(path: Optional[str]):
+    """Best-effort removal of a downloaded temp file"""
+    if not path:
+        return
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+# Default legal metadata schema
+_DEFAULT_METADATA_SCHEMA: Dict[str, Any] = {
+    "document_id": "string",
+    "title": "string",
+    "court_name": "string",
+    "case_number": "string",
+    "case_type": "string",
+    "decision_date": "YYYY-MM-DD",
+    "coram": "string",
+    "petitioner": "string",
+    "respondent": "string",
+    "key_issues": "string"
+}
+_DEFAULT_METADATA_SCHEMA_JSON = json.dumps(_DEFAULT_METADATA_SCHEMA, indent=2)
+
+_METADATA_PROMPT_TEMPLATE = """You are an expert legal document analyst.
+
+Extract the following structured metadata from the provided legal document text. Return ONLY valid JSON matching the exact schema below. Do not include any explanatory text or markdown formatting, only the JSON object.
+
+Important: All fields should be strings (not arrays or objects). For multiple values (like multiple parties or issues), combine them into a single comma-separated string.
+
+Schema:
+{schema_json}
+
+Document Text:
+{text}
+
+Return the extracted metadata as a JSON object matching the schema exactly. All values must be strings."""
+
+
+@lru_cache(maxsize=1)
+def _get_embedding_encoding() -> tiktoken.Encoding:
+    """Get (and cache) the tokenizer used by the embedding model"""
+    return tiktoken.encoding_for_model(EMBEDDING_MODEL)
+
+
+@lru_cache(maxsize=1)
+def _get_pinecone_index(api_key: str, index_name: str, dimension: int):
+    """
+    Get (and cache) the Pinecone index handle used for ingestion
+    
+    The index existence check (and creation, if missing) runs once per process
+    instead of on every IngestionService construction. Uses the gRPC client so
+    upserts are sent as binary protobuf rather than JSON.
+    
+    Args:
+        api_key: Pinecone API key
+        index_name: Pinecone index name
+        dimension: Embedding dimension used when the index has to be created
+        
+    Returns:
+        Pinecone gRPC index handle
+    """
+    pinecone_client = PineconeGRPC(api_key=api_key)
+    
+    existing_indexes = [idx.name for idx in pinecone_client.list_indexes()]
+    if index_name not in existing_indexes:
+        logger.info(f"Creating Pinecone index: {index_name}")
+        pinecone_client.create_index(
+            name=index_name,
+            dimension=dimension,
+            metric="cosine",
+            spec=ServerlessSpec(
+                cloud="aws",
+                region="us-east-1"
+            )
+        )
+        logger.success(f"Created Pinecone index: {index_name}")
+    else:
+        logger.info(f"Using existing Pinecone index: {index_name}")
+    
+    return pinecone_client.Index(index_name)
+
+
 class IngestionService:
     """Service for end-to-end ingestion pipeline"""
     
@@ -27,11 +133,10 @@ class IngestionService:
             raise ValueError("OPENAI_API_KEY configuration is required")
         self.openai_client = OpenAI(api_key=openai_api_key)
 
-        # Initialize Pinecone client
+        # Initialize Pinecone index (client and index handle are shared per process)
         pinecone_api_key = settings.PINECONE_API_KEY
         if not pinecone_api_key:
             raise ValueError("PINECONE_API_KEY configuration is required")
-        self.pinecone_client = Pinecone(api_key=pinecone_api_key)
 
         pinecone_index_name = settings.PINECONE_INDEX_NAME
         if not pinecone_index_name:
@@ -42,76 +147,44 @@ class IngestionService:
         if not embedding_dimension:
             raise ValueError("EMBEDDING_DIMENSION configuration is required")
         
-        # Get or create Pinecone index
         try:
-            existing_indexes = [idx.name for idx in self.pinecone_client.list_indexes()]
-            if pinecone_index_name not in existing_indexes:
-                logger.info(f"Creating Pinecone index: {pinecone_index_name}")
-                self.pinecone_client.create_index(
-                    name=pinecone_index_name,
-                    dimension=embedding_dimension,
-                    metric="cosine",
-                    spec=ServerlessSpec(
-                        cloud="aws",
-                        region="us-east-1"
-                    )
-                )
-                logger.success(f"Created Pinecone index: {pinecone_index_name}")
-            else:
-                logger.info(f"Using existing Pinecone index: {pinecone_index_name}")
-            
-            self.pinecone_index = self.pinecone_client.Index(pinecone_index_name)
+            self.pinecone_index = _get_pinecone_index(
+                pinecone_api_key,
+                pinecone_index_name,
+                embedding_dimension
+            )
         except Exception as e:
             logger.error(f"Failed to initialize Pinecone index: {e}")
             raise
     
     def _get_default_metadata_schema(self) -> Dict[str, Any]:
         """Get default legal metadata schema"""
-        return {
-            "document_id": "string",
-            "title": "string",
-            "court_name": "string",
-            "case_number": "string",
-            "case_type": "string",
-            "decision_date": "YYYY-MM-DD",
-            "coram": "string",
-            "petitioner": "string",
-            "respondent": "string",
-            "key_issues": "string"
-        }
+        return dict(_DEFAULT_METADATA_SCHEMA)
     
     def _generate_metadata_extraction_prompt(
         self,
         full_text: str,
-        metadata_keys: Dict[str, Any]
+        metadata_keys: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Generate GPT prompt for metadata extraction
         
         Args:
             full_text: Full OCR text from document
-            metadata_keys: Metadata schema dictionary
+            metadata_keys: Metadata schema dictionary (uses the precomputed default schema if None)
             
         Returns:
             Formatted prompt string
         """
-        schema_json = json.dumps(metadata_keys, indent=2)
-        
-        prompt = f"""You are an expert legal document analyst.
-
-Extract the following structured metadata from the provided legal document text. Return ONLY valid JSON matching the exact schema below. Do not include any explanatory text or markdown formatting, only the JSON object.
-
-Important: All fields should be strings (not arrays or objects). For multiple values (like multiple parties or issues), combine them into a single comma-separated string.
-
-Schema:
-{schema_json}
-
-Document Text:
-{full_text[:15000]}
-
-Return the extracted metadata as a JSON object matching the schema exactly. All values must be strings."""
+        if metadata_keys is None:
+            schema_json = _DEFAULT_METADATA_SCHEMA_JSON
+        else:
+            schema_json = json.dumps(metadata_keys, indent=2)
         
-        return prompt
+        return _METADATA_PROMPT_TEMPLATE.format(
+            schema_json=schema_json,
+            text=full_text[:METADATA_TEXT_MAX_CHARS]
+        )
     
     async def extract_metadata(
         self,
@@ -128,11 +201,7 @@ Return the extracted metadata as a JSON object matching the schema exactly. All
         Returns:
             Extracted metadata dictionary
         """
-        # Use default schema if not provided
-        if metadata_keys is None:
-            metadata_keys = self._get_default_metadata_schema()
-        
-        # Generate prompt
+        # Generate prompt (default schema is used if metadata_keys is None)
         prompt = self._generate_metadata_extraction_prompt(full_text, metadata_keys)
         
         try:
@@ -178,30 +247,31 @@ Return the extracted metadata as a JSON object matching the schema exactly. All
         except Exception as e:
             logger.error(f"Failed to extract metadata: {e}")
             # Return empty metadata with defaults
-            return {
-                "document_id": "",
-                "title": "",
-                "court_name": "",
-                "case_number": "",
-                "case_type": "",
-                "decision_date": "",
-                "coram": "",
-                "petitioner": "",
-                "respondent": "",
-                "key_issues": ""
-            }
+            return {key: "" for key in _DEFAULT_METADATA_SCHEMA}
     
-    def _normalize_metadata_for_pinecone(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def _normalize_metadata_for_pinecone(
+        self,
+        metadata: Dict[str, Any],
+        pre_normalized: bool = False
+    ) -> Dict[str, Any]:
         """
         Normalize metadata values to be compatible with Pinecone requirements.
         Pinecone only accepts: string, number, boolean, or list of strings.
         
         Args:
             metadata: Metadata dictionary that may contain arrays or nested structures
+            pre_normalized: Set when every value is already a primitive (e.g. the output
+                of extract_metadata plus chunk fields); only long strings are truncated
             
         Returns:
             Normalized metadata dictionary compatible with Pinecone
         """
+        if pre_normalized:
+            return {
+                key: value[:1000] if isinstance(value, str) and len(value) > 1000 else value
+                for key, value in metadata.items()
+            }
+        
         normalized = {}
         
         for key, value in metadata.items():
@@ -231,7 +301,30 @@ Return the extracted metadata as a JSON object matching the schema exactly. All
         
         return normalized
     
-    def generate_embedding(self, text: str) -> List[float]:
+    def _split_for_embedding(self, text: str) -> List[str]:
+        """
+        Split text into pieces that fit the embedding model's input limit
+        
+        Args:
+            text: Chunk text to embed
+            
+        Returns:
+            List with the original text, or several sub-texts if it is over the token limit
+        """
+        encoding = _get_embedding_encoding()
+        tokens = encoding.encode(text)
+        if len(tokens) <= EMBEDDING_MAX_TOKENS:
+            return [text]
+        
+        logger.warning(
+            f"Chunk has {len(tokens)} tokens (limit {EMBEDDING_MAX_TOKENS}), splitting before embedding"
+        )
+        return [
+            encoding.decode(tokens[i:i + EMBEDDING_MAX_TOKENS])
+            for i in range(0, len(tokens), EMBEDDING_MAX_TOKENS)
+        ]
+    
+    def generate_embedding(self, text: str) -> np.ndarray:
         """
         Generate embedding for text using text-embedding-3-small
         
@@ -239,18 +332,106 @@ Return the extracted metadata as a JSON object matching the schema exactly. All
             text: Text to embed
             
         Returns:
-            Embedding vector (1536 dimensions)
+            Embedding vector (1536 dimensions, float32)
         """
         try:
             response = self.openai_client.embeddings.create(
-                model="text-embedding-3-small",
+                model=EMBEDDING_MODEL,
                 input=text
             )
-            return response.data[0].embedding
+            return np.asarray(response.data[0].embedding, dtype=np.float32)
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             raise
     
+    def generate_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Generate embeddings for many texts using batched text-embedding-3-small calls
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors (float32) in the same order as texts
+        """
+        embeddings: List[np.ndarray] = []
+        batch: List[str] = []
+        batch_chars = 0
+        
+        for text in texts:
+            if batch and (
+                len(batch) >= EMBEDDING_BATCH_SIZE
+                or batch_chars + len(text) > EMBEDDING_BATCH_MAX_CHARS
+            ):
+                embeddings.extend(self._embed_batch(batch))
+                batch = []
+                batch_chars = 0
+            batch.append(text)
+            batch_chars += len(text)
+        
+        if batch:
+            embeddings.extend(self._embed_batch(batch))
+        
+        return embeddings
+    
+    def _embed_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """Embed one batch of texts with a single API call"""
+        try:
+            response = self.openai_client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=texts
+            )
+            # Results carry their input index; don't rely on response ordering
+            return [
+                np.asarray(item.embedding, dtype=np.float32)
+                for item in sorted(response.data, key=lambda item: item.index)
+            ]
+        except Exception as e:
+            logger.error(f"Failed to generate embeddings for batch of {len(texts)}: {e}")
+            raise
+    
+    async def _prefetch_downloads(
+        self,
+        gdrive_service: GoogleDriveService,
+        files: List[Dict[str, Any]],
+        download_queue: asyncio.Queue
+    ):
+        """
+        Download files in a worker thread ahead of the processing loop
+        
+        Each file is streamed in chunks to a temp file rather than buffered in memory.
+        Puts (file_info, temp_path, error) tuples on the queue in file order so that
+        the next download overlaps with OCR/embedding of the current file. The bounded
+        queue keeps at most a couple of downloaded files waiting on disk; the consumer
+        owns (and removes) every temp path it receives.
+        
+        Args:
+            gdrive_service: Google Drive service
+            files: File metadata dictionaries from list_files_in_folder
+            download_queue: Bounded queue consumed by run_pipeline
+        """
+        for file_info in files:
+            temp_path = None
+            try:
+                fd, temp_path = tempfile.mkstemp(
+                    prefix="ingest_", suffix=os.path.splitext(file_info['name'])[1]
+                )
+                os.close(fd)
+                await asyncio.to_thread(gdrive_service.download_file_to, file_info['id'], temp_path)
+            except asyncio.CancelledError:
+                _remove_temp_file(temp_path)
+                raise
+            except Exception as e:
+                _remove_temp_file(temp_path)
+                await download_queue.put((file_info, None, e))
+                continue
+            
+            try:
+                await download_queue.put((file_info, temp_path, None))
+            except asyncio.CancelledError:
+                _remove_temp_file(temp_path)
+                raise
+    
     async def run_pipeline(
         self,
         dataset_name: str,
@@ -344,115 +525,123 @@ Return the extracted metadata as a JSON object matching the schema exactly. All
         files_embedded = 0
         files_embedding_failed = 0
         
-        # Process each file
-        for file_info in files:
-            file_id = file_info['id']
-            file_name = file_info['name']
-            file_path = file_info['path']
-            mime_type = file_info.get('mimeType')
-            
-            logger.info(f"Processing file: {file_name}")
-            
-            # Construct Google Drive public view URL
-            source_url = f"https://drive.google.com/file/d/{file_id}/view"
-            
-            # Create document record in MongoDB
-            doc_id = mongodb_service.create_doc(
-                job_id=job_id,
-                dataset_name=dataset_name,
-                source_drive_file_id=file_id,
-                source_path=file_path,
-                source_url=source_url
+        # Create all document records up front in bulk
+        doc_ids = mongodb_service.create_docs_bulk(
+            job_id=job_id,
+            dataset_name=dataset_name,
+            docs=[
+                {
+                    "source_drive_file_id": file_info['id'],
+                    "source_path": file_info['path'],
+                    "source_url": f"https://drive.google.com/file/d/{file_info['id']}/view"
+                }
+                for file_info in files
+            ]
+        )
+        
+        # Look up already-embedded files in one pass (unless force)
+        embedded_file_ids = set()
+        if not force:
+            embedded_file_ids = mongodb_service.filter_unembedded(
+                [file_info['id'] for file_info in files],
+                dataset_name
             )
-            
-            # Determine output path (mirror structure under "Optical Character Recognition")
-            # Same logic as OCR endpoint
-            if file_path.startswith(f"{dataset_name}/"):
-                relative_path = file_path[len(f"{dataset_name}/"):]
-            elif file_path == dataset_name:
-                relative_path = ""
-            else:
-                relative_path = file_path
-            
-            # Get directory and filename
-            if relative_path:
-                dir_path = os.path.dirname(relative_path)
-                base_name = os.path.splitext(file_name)[0]
-                output_file_name = f"{base_name}.json"
+        
+        # Downloads run one file ahead of processing
+        download_queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        prefetch_task = asyncio.create_task(
+            self._prefetch_downloads(gdrive_service, files, download_queue)
+        )
+        
+        # Process each file
+        download_path = None
+        try:
+            for _ in range(len(files)):
+                # The previous file is fully processed once we come back round
+                _remove_temp_file(download_path)
+                file_info, download_path, download_error = await download_queue.get()
+                file_id = file_info['id']
+                file_name = file_info['name']
+                file_path = file_info['path']
+                mime_type = file_info.get('mimeType')
                 
-                if dir_path:
-                    output_path = f"{dataset_name}/{dir_path}/{output_file_name}"
-                    output_dir_path = f"{dataset_name}/{dir_path}"
+                logger.info(f"Processing file: {file_name}")
+                
+                # Construct Google Drive public view URL
+                source_url = f"https://drive.google.com/file/d/{file_id}/view"
+                
+                # Document record was created in bulk before the loop
+                doc_id = doc_ids[file_id]
+                
+                # Determine output path (mirror structure under "Optical Character Recognition")
+                # Same logic as OCR endpoint
+                if file_path.startswith(f"{dataset_name}/"):
+                    relative_path = file_path[len(f"{dataset_name}/"):]
+                elif file_path == dataset_name:
+                    relative_path = ""
+                else:
+                    relative_path = file_path
+                
+                # Get directory and filename
+                if relative_path:
+                    dir_path = os.path.dirname(relative_path)
+                    base_name = os.path.splitext(file_name)[0]
+                    output_file_name = f"{base_name}.json"
+                    
+                    if dir_path:
+                        output_path = f"{dataset_name}/{dir_path}/{output_file_name}"
+                        output_dir_path = f"{dataset_name}/{dir_path}"
+                    else:
+                        output_path = f"{dataset_name}/{output_file_name}"
+                        output_dir_path = dataset_name
                 else:
+                    base_name = os.path.splitext(file_name)[0]
+                    output_file_name = f"{base_name}.json"
                     output_path = f"{dataset_name}/{output_file_name}"
                     output_dir_path = dataset_name
-            else:
-                base_name = os.path.splitext(file_name)[0]
-                output_file_name = f"{base_name}.json"
-                output_path = f"{dataset_name}/{output_file_name}"
-                output_dir_path = dataset_name
-            
-            # Ensure output folder hierarchy exists
-            output_parent_folder_id = output_dataset_folder_id
-            if output_dir_path and output_dir_path != dataset_name:
-                subfolder_path = output_dir_path.replace(f"{dataset_name}/", "")
-                if subfolder_path:
-                    output_parent_folder_id = gdrive_service.ensure_folder_hierarchy(
-                        folder_path=subfolder_path,
-                        parent_folder_id=output_dataset_folder_id
-                    )
-            
-            # Check if already embedded (unless force)
-            skip_embedding = False
-            if not force:
-                if mongodb_service.is_doc_embedded(file_id, dataset_name):
-                    logger.info(f"Skipping embedding for {file_name}: already embedded")
-                    skip_embedding = True
-            
-            # Check if OCR JSON already exists (unless force)
-            existing_json_file_id = None
-            if not force:
-                existing_json_file_id = gdrive_service.file_exists_in_folder(
-                    file_name=output_file_name,
-                    folder_id=output_parent_folder_id
-                )
-            
-            try:
-                mongodb_service.update_doc_status(doc_id, "processing", "Downloading file")
                 
-                # Download file
-                file_bytes = gdrive_service.download_file(file_id)
+                # Ensure output folder hierarchy exists
+                output_parent_folder_id = output_dataset_folder_id
+                if output_dir_path and output_dir_path != dataset_name:
+                    subfolder_path = output_dir_path.replace(f"{dataset_name}/", "")
+                    if subfolder_path:
+                        output_parent_folder_id = gdrive_service.ensure_folder_hierarchy(
+                            folder_path=subfolder_path,
+                            parent_folder_id=output_dataset_folder_id
+                        )
                 
-                # Process OCR document
-                ocr_result = ocr_service.process_document(
-                    file_bytes=file_bytes,
-                    file_name=file_name,
-                    mime_type=mime_type
-                )
+                # Check if already embedded (unless force)
+                skip_embedding = False
+                if not force:
+                    if file_id in embedded_file_ids:
+                        logger.info(f"Skipping embedding for {file_name}: already embedded")
+                        skip_embedding = True
                 
-                # Check if document has no chunks
-                if ocr_result['chunks_emitted'] == 0:
-                    mongodb_service.update_doc_status(doc_id, "failed", "No extractable text found")
-                    mongodb_service.update_doc_counts(doc_id, {
-                        "pages_total": ocr_result['total_page_count'],
-                        "pages_without_text": ocr_result['pages_without_text'],
-                        "chunks_emitted": 0,
-                        "lang_undetected_count": 1 if ocr_result['lang_undetected'] else 0
-                    })
-                    mongodb_service.update_job_counters(job_id, {
-                        "files_failed": 1,
-                        "pages_processed": ocr_result['total_page_count'],
-                        "pages_without_text": ocr_result['pages_without_text'],
-                        "lang_undetected_count": 1 if ocr_result['lang_undetected'] else 0
-                    })
-                    files_failed += 1
-                    continue
+                # Check if OCR JSON already exists (unless force)
+                existing_json_file_id = None
+                if not force:
+                    existing_json_file_id = gdrive_service.file_exists_in_folder(
+                        file_name=output_file_name,
+                        folder_id=output_parent_folder_id
+                    )
                 
-                # Store OCR JSON file (if not exists or force)
-                if not existing_json_file_id or force:
-                    json_chunks = []
-                    for chunk in ocr_result['chunks']:
-                        json_chunks.append({
+                try:
+                    mongodb_service.update_doc(doc_id, status="processing", message="Downloading file")
+                    
+                    # Download was prefetched in the background
+                    if download_error is not None:
+                        raise download_error
+                    
+                    # Process OCR document; chunks are built straight into their output
+                    # records (OCR JSON, ocr_chunks, embedding input) as pages are chunked
+                    ocr_result, chunk_iter = ocr_service.process_document_streaming(
+                        file_bytes=None,
+                        file_path=download_path,
+                        file_name=file_name,
+                        mime_type=mime_type
+                    )
+                    json_chunks = [
+                        {
                             "doc_id": chunk['doc_id'],
                             "file_name": chunk['file_name'],
                             "language": chunk['language'],
@@ -461,139 +650,228 @@ Return the extracted metadata as a JSON object matching the schema exactly. All
                             "chunk_index": chunk['chunk_index'],
                             "text": chunk['text'],
                             "source_url": source_url
-                        })
-                    
-                    json_content = json.dumps(json_chunks, ensure_ascii=False, indent=2)
-                    json_bytes = json_content.encode('utf-8')
+                        }
+                        for chunk in chunk_iter
+                    ]
+                    ocr_result['chunks_emitted'] = len(json_chunks)
                     
-                    output_file_info = gdrive_service.upload_file_from_bytes(
-                        file_bytes=json_bytes,
-                        file_name=output_file_name,
-                        folder_id=output_parent_folder_id,
-                        mime_type="application/json"
-                    )
+                    # Check if document has no chunks
+                    if ocr_result['chunks_emitted'] == 0:
+                        mongodb_service.update_doc(
+                            doc_id,
+                            status="failed",
+                            message="No extractable text found",
+                            counts={
+                                "pages_total": ocr_result['total_page_count'],
+                                "pages_without_text": ocr_result['pages_without_text'],
+                                "chunks_emitted": 0,
+                                "lang_undetected_count": 1 if ocr_result['lang_undetected'] else 0
+                            }
+                        )
+                        mongodb_service.update_job_counters(job_id, {
+                            "files_failed": 1,
+                            "pages_processed": ocr_result['total_page_count'],
+                            "pages_without_text": ocr_result['pages_without_text'],
+                            "lang_undetected_count": 1 if ocr_result['lang_undetected'] else 0
+                        })
+                        files_failed += 1
+                        continue
                     
-                    output_drive_file_id = output_file_info['file_id']
-                    mongodb_service.update_doc_output(doc_id, output_drive_file_id, output_path)
-                else:
-                    logger.info(f"OCR JSON already exists for {file_name}, skipping upload")
-                    output_drive_file_id = existing_json_file_id
-                    mongodb_service.update_doc_output(doc_id, output_drive_file_id, output_path)
-                    mongodb_service.update_doc_status(doc_id, "skipped", "OCR JSON already exists")
-                
-                # Update OCR counts
-                mongodb_service.update_doc_counts(doc_id, {
-                    "pages_total": ocr_result['total_page_count'],
-                    "pages_without_text": ocr_result['pages_without_text'],
-                    "chunks_emitted": ocr_result['chunks_emitted'],
-                    "lang_undetected_count": 1 if ocr_result['lang_undetected'] else 0
-                })
-                
-                mongodb_service.update_job_counters(job_id, {
-                    "files_processed": 1,
-                    "pages_processed": ocr_result['total_page_count'],
-                    "pages_without_text": ocr_result['pages_without_text'],
-                    "chunks_emitted": ocr_result['chunks_emitted'],
-                    "lang_undetected_count": 1 if ocr_result['lang_undetected'] else 0
-                })
-                
-                files_processed += 1
-                
-                # Extract metadata for embedding
-                if not skip_embedding:
-                    try:
-                        mongodb_service.update_doc_status(doc_id, "processing", "Extracting metadata and generating embeddings")
+                    # Store OCR JSON file (if not exists or force)
+                    doc_status = None
+                    doc_message = None
+                    if not existing_json_file_id or force:
+                        json_content = json.dumps(json_chunks, ensure_ascii=False, indent=2)
+                        json_bytes = json_content.encode('utf-8')
                         
-                        # Extract full text for metadata extraction
-                        full_text, _, _ = ocr_service.extract_text(
-                            file_bytes=file_bytes,
-                            file_name=file_name,
-                            mime_type=mime_type
+                        output_file_info = gdrive_service.upload_file_from_bytes(
+                            file_bytes=json_bytes,
+                            file_name=output_file_name,
+                            folder_id=output_parent_folder_id,
+                            mime_type="application/json"
                         )
                         
-                        # Extract metadata using GPT
-                        metadata = await self.extract_metadata(full_text, metadata_keys)
+                        output_drive_file_id = output_file_info['file_id']
                         
-                        # Generate embeddings and upsert to Pinecone
-                        vectors_to_upsert = []
-                        for chunk in ocr_result['chunks']:
-                            chunk_text = chunk['text']
-                            chunk_index = chunk['chunk_index']
-                            page_index = chunk['page_index']
-                            
-                            # Generate embedding
-                            embedding = self.generate_embedding(chunk_text)
-                            
-                            # Prepare metadata for Pinecone
-                            chunk_metadata = {
-                                "dataset_name": dataset_name,
-                                "source_file": file_name,
-                                "text": chunk_text,
-                                "chunk_index": chunk_index,
-                                "page_index": page_index,
-                                "source_url": source_url
-                            }
-                            
-                            # Add extracted metadata
-                            chunk_metadata.update(metadata)
+                        # Persist chunk records in one batched write per document
+                        mongodb_service.insert_chunks(doc_id, job_id, json_chunks)
+                    else:
+                        logger.info(f"OCR JSON already exists for {file_name}, skipping upload")
+                        output_drive_file_id = existing_json_file_id
+                        doc_status = "skipped"
+                        doc_message = "OCR JSON already exists"
+                    
+                    # Record output and OCR counts in one write
+                    mongodb_service.update_doc(
+                        doc_id,
+                        status=doc_status,
+                        message=doc_message,
+                        output_drive_file_id=output_drive_file_id,
+                        output_path=output_path,
+                        counts={
+                            "pages_total": ocr_result['total_page_count'],
+                            "pages_without_text": ocr_result['pages_without_text'],
+                            "chunks_emitted": ocr_result['chunks_emitted'],
+                            "lang_undetected_count": 1 if ocr_result['lang_undetected'] else 0
+                        }
+                    )
+                    
+                    mongodb_service.update_job_counters(job_id, {
+                        "files_processed": 1,
+                        "pages_processed": ocr_result['total_page_count'],
+                        "pages_without_text": ocr_result['pages_without_text'],
+                        "chunks_emitted": ocr_result['chunks_emitted'],
+                        "lang_undetected_count": 1 if ocr_result['lang_undetected'] else 0
+                    })
+                    
+                    files_processed += 1
+                    
+                    # Extract metadata for embedding
+                    if not skip_embedding:
+                        try:
+                            mongodb_service.update_doc(
+                                doc_id,
+                                status="processing",
+                                message="Extracting metadata and generating embeddings"
+                            )
                             
-                            # Normalize metadata for Pinecone compatibility
-                            chunk_metadata = self._normalize_metadata_for_pinecone(chunk_metadata)
+                            # Extract metadata using GPT (from the text already extracted by OCR)
+                            metadata = await self.extract_metadata(ocr_result['text'], metadata_keys)
                             
-                            # Generate unique ID with page_index for better idempotence
+                            # Generate unique ID prefix (page_index is added per vector for better idempotence)
                             doc_id_str = metadata.get("document_id", f"doc_{file_name}_{files_processed}")
                             doc_id_str = str(doc_id_str).replace(" ", "_").replace("/", "_")[:50]
-                            vector_id = f"{doc_id_str}_p{page_index}_c{chunk_index}"
                             
-                            vectors_to_upsert.append({
-                                "id": vector_id,
-                                "values": embedding,
-                                "metadata": chunk_metadata
-                            })
+                            # Collect embedding inputs as (vector_id, text, page_index, chunk_index)
+                            pending_vectors = []
+                            for chunk in json_chunks:
+                                chunk_text = chunk['text']
+                                chunk_index = chunk['chunk_index']
+                                page_index = chunk['page_index']
+                                
+                                # Empty chunks would only waste an embedding call
+                                if not chunk_text.strip():
+                                    continue
+                                
+                                vector_id = f"{doc_id_str}_p{page_index}_c{chunk_index}"
+                                
+                                # Oversized chunks are split locally instead of failing the API call
+                                sub_texts = self._split_for_embedding(chunk_text)
+                                for sub_index, sub_text in enumerate(sub_texts):
+                                    pending_vectors.append((
+                                        vector_id if len(sub_texts) == 1 else f"{vector_id}_s{sub_index}",
+                                        sub_text,
+                                        page_index,
+                                        chunk_index
+                                    ))
                             
-                            embeddings_stored += 1
-                        
-                        # Upsert to Pinecone
-                        if vectors_to_upsert:
-                            self.pinecone_index.upsert(vectors=vectors_to_upsert)
+                            # Embed each distinct text once: repeated headers/footers share a vector
+                            unique_texts = list(dict.fromkeys(text for _, text, _, _ in pending_vectors))
+                            embeddings_by_text = dict(zip(unique_texts, self.generate_embeddings(unique_texts)))
+                            if len(unique_texts) < len(pending_vectors):
+                                logger.debug(
+                                    f"Embedding {len(unique_texts)} unique texts for "
+                                    f"{len(pending_vectors)} chunks in {file_name}"
+                                )
                             
-                            # Mark as embedded in MongoDB
-                            mongodb_service.mark_doc_embedded(
-                                doc_id=doc_id,
-                                embeddings_count=len(vectors_to_upsert),
-                                pinecone_index=self.pinecone_index_name
-                            )
+                            # Build Pinecone vectors
+                            vectors_to_upsert = []
+                            for vector_id, text, page_index, chunk_index in pending_vectors:
+                                # Prepare metadata for Pinecone
+                                chunk_metadata = {
+                                    "dataset_name": dataset_name,
+                                    "source_file": file_name,
+                                    "text": text,
+                                    "chunk_index": chunk_index,
+                                    "page_index": page_index,
+                                    "source_url": source_url
+                                }
+                                
+                                # Add extracted metadata
+                                chunk_metadata.update(metadata)
+                                
+                                # Normalize metadata for Pinecone compatibility (extracted metadata
+                                # is already string-only, so only truncation is needed)
+                                chunk_metadata = self._normalize_metadata_for_pinecone(
+                                    chunk_metadata,
+                                    pre_normalized=True
+                                )
+                                
+                                vectors_to_upsert.append(Vector(
+                                    id=vector_id,
+                                    values=embeddings_by_text[text],
+                                    metadata=chunk_metadata
+                                ))
+                                
+                                embeddings_stored += 1
                             
-                            mongodb_service.update_job_embedding_counters(job_id, {
-                                "files_embedded": 1,
-                                "embeddings_stored": len(vectors_to_upsert)
-                            })
+                            # Upsert to Pinecone
+                            embedded_fields = {}
+                            if vectors_to_upsert:
+                                self.pinecone_index.upsert(
+                                    vectors=vectors_to_upsert,
+                                    batch_size=PINECONE_UPSERT_BATCH_SIZE
+                                )
+                                
+                                # Marked as embedded together with the final status below
+                                embedded_fields = {
+                                    "embedded": True,
+                                    "embeddings_count": len(vectors_to_upsert),
+                                    "pinecone_index": self.pinecone_index_name,
+                                    "embedded_at": datetime.now(timezone.utc)
+                                }
+                                
+                                mongodb_service.update_job_embedding_counters(job_id, {
+                                    "files_embedded": 1,
+                                    "embeddings_stored": len(vectors_to_upsert)
+                                })
+                                
+                                files_embedded += 1
+                                logger.success(
+                                    f"Upserted {len(vectors_to_upsert)} vectors to Pinecone for: {file_name}"
+                                )
                             
-                            files_embedded += 1
-                            logger.success(
-                                f"Upserted {len(vectors_to_upsert)} vectors to Pinecone for: {file_name}"
+                            mongodb_service.update_doc(
+                                doc_id,
+                                status="ok",
+                                message="Processed and embedded successfully",
+                                now=embedded_fields.get("embedded_at"),
+                                **embedded_fields
                             )
-                        
-                        mongodb_service.update_doc_status(doc_id, "ok", "Processed and embedded successfully")
-                        
-                    except Exception as e:
-                        logger.error(f"Error embedding file {file_name}: {e}")
-                        mongodb_service.update_doc_status(doc_id, "ok", f"OCR completed but embedding failed: {str(e)}")
-                        mongodb_service.update_job_embedding_counters(job_id, {"files_embedding_failed": 1})
-                        files_embedding_failed += 1
-                        if force:
-                            raise
-                else:
-                    mongodb_service.update_doc_status(doc_id, "ok", "OCR completed, embedding skipped (already embedded)")
-                    files_skipped += 1
-                
-            except Exception as e:
-                logger.error(f"Error processing file {file_name}: {e}")
-                mongodb_service.update_doc_status(doc_id, "failed", str(e))
-                mongodb_service.update_job_counters(job_id, {"files_failed": 1})
-                files_failed += 1
-                if force:
-                    raise
+                            
+                        except Exception as e:
+                            logger.error(f"Error embedding file {file_name}: {e}")
+                            mongodb_service.update_doc(
+                                doc_id,
+                                status="ok",
+                                message=f"OCR completed but embedding failed: {str(e)}"
+                            )
+                            mongodb_service.update_job_embedding_counters(job_id, {"files_embedding_failed": 1})
+                            files_embedding_failed += 1
+                            if force:
+                                raise
+                    else:
+                        mongodb_service.update_doc(
+                            doc_id,
+                            status="ok",
+                            message="OCR completed, embedding skipped (already embedded)"
+                        )
+                        files_skipped += 1
+                    
+                except Exception as e:
+                    logger.error(f"Error processing file {file_name}: {e}")
+                    mongodb_service.update_doc(doc_id, status="failed", message=str(e))
+                    mongodb_service.update_job_counters(job_id, {"files_failed": 1})
+                    files_failed += 1
+                    if force:
+                        raise
+        finally:
+            _remove_temp_file(download_path)
+            prefetch_task.cancel()
+            # Discard downloads that were queued but never processed
+            while not download_queue.empty():
+                _, leftover_path, _ = download_queue.get_nowait()
+                _remove_temp_file(leftover_path)
         
         # Determine final job status
         if files_failed == 0:
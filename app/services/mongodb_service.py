@@ -1,18 +1,92 @@
 """
 MongoDB service for OCR progress tracking
 """
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from itertools import islice
+from typing import Optional, Dict, Any, Iterable, List, Set
 
+import bson
 from bson import ObjectId
+from bson.codec_options import CodecOptions
+from bson.int64 import Int64
 from loguru import logger
-from pymongo import MongoClient
+from pymongo import ASCENDING, DESCENDING, IndexModel, MongoClient, ReturnDocument, UpdateOne
+from pymongo.collection import Collection
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import ReadPreference
+from pymongo.write_concern import WriteConcern
 from pymongo.database import Database
+from pymongo.errors import BulkWriteError, OperationFailure
 from urllib.parse import quote_plus
 
 from app.config import settings
 
 
+# BSON encoding of every small update is client-side hot work; the C extension is
+# several times faster than the pure-Python fallback
+if not bson.has_c():
+    logger.warning(
+        "bson C extension is not available; MongoDB operations will use the slow "
+        "pure-Python encoder. Install a pymongo binary wheel for this platform."
+    )
+
+# Shared by every collection handle (inherited from the database)
+_CODEC = CodecOptions(tz_aware=True, tzinfo=timezone.utc)
+
+# Job progress counters, stored as flat top-level fields (c_<name> for OCR counters,
+# ec_<name> for embedding counters) so $inc never walks into a subdocument
+JOB_COUNTER_FIELDS = (
+    "files_discovered",
+    "files_processed",
+    "files_failed",
+    "pages_processed",
+    "pages_without_text",
+    "chunks_emitted",
+    "lang_undetected_count"
+)
+JOB_EMBEDDING_COUNTER_FIELDS = (
+    "files_embedded",
+    "embeddings_stored",
+    "files_embedding_failed"
+)
+COUNTER_PREFIX = "c_"
+EMBEDDING_COUNTER_PREFIX = "ec_"
+
+# Read projections: only fetch the fields callers use. With the matching indexes
+# below these reads are covered (answered from the index, no document fetch).
+_ID_ONLY = {"_id": 1}
+_DOC_ID_BY_FILE = {"_id": 1, "source_drive_file_id": 1}
+_FILE_ID_ONLY = {"source_drive_file_id": 1, "_id": 0}
+
+# Compound index serving the "already embedded?" check (equality on all three
+# fields); also used as a query hint, once index creation has succeeded, so the
+# planner can't pick the unique index
+_EMBEDDED_LOOKUP_INDEX = [
+    ("dataset_name", ASCENDING),
+    ("source_drive_file_id", ASCENDING),
+    ("embedded", ASCENDING)
+]
+
+# Largest datasets (by files discovered) that get their own partial index on
+# source_drive_file_id; small per-tenant indexes stay resident in RAM
+PARTIAL_INDEX_TOP_DATASETS = 5
+
+# Job statuses after which a job is only kept for OCR_JOB_TTL_DAYS
+TERMINAL_JOB_STATUSES = ["completed", "completed_with_errors", "failed"]
+
+# Document statuses after which a document (and its chunks) is only kept for
+# OCR_JOB_TTL_DAYS, the same retention as its job
+TERMINAL_DOC_STATUSES = ["ok", "failed", "skipped"]
+
+# Chunk records per insert_many call
+CHUNK_INSERT_BATCH_SIZE = 1000
+
+# Failed flushes after which a buffered counter increment or document update is dropped
+COUNTER_FLUSH_MAX_ATTEMPTS = 3
+
+
 def get_mongo_client(uri: Optional[str] = None) -> MongoClient:
     """
     Creates and returns a secure MongoDB client using credentials from .env
@@ -25,13 +99,29 @@ def get_mongo_client(uri: Optional[str] = None) -> MongoClient:
         
     Raises:
         ValueError: If required credentials are missing
-        Exception: If connection fails
+        
+    Note:
+        The client connects lazily; use MongoDBService.healthcheck() to verify
+        that the server is reachable.
     """
+    # Pool / wire options, sized for many concurrent OCR and embedding workers
+    # issuing small updates; zlib is the stdlib fallback for servers without zstd
+    client_options = {
+        "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": settings.MONGO_MAX_IDLE_TIME_MS,
+        "waitQueueTimeoutMS": settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        "retryWrites": True,
+        "w": int(settings.MONGO_WRITE_CONCERN) if settings.MONGO_WRITE_CONCERN.isdigit() else settings.MONGO_WRITE_CONCERN,
+        "compressors": settings.MONGO_COMPRESSORS,
+    }
+    
     if uri:
         # Use provided URI if explicitly supplied
         client = MongoClient(
             uri,
-            serverSelectionTimeoutMS=5000
+            serverSelectionTimeoutMS=5000,
+            **client_options
         )
     else:
         # Construct URI from application settings
@@ -60,23 +150,252 @@ def get_mongo_client(uri: Optional[str] = None) -> MongoClient:
         client = MongoClient(
             uri,
             tls=True,  # Enables TLS (SSL)
-            serverSelectionTimeoutMS=5000  # Fails fast if server not reachable
+            serverSelectionTimeoutMS=5000,  # Fails fast if server not reachable
+            **client_options
         )
     
-    try:
-        # Ping the database to ensure connection is successful
-        client.admin.command("ping")
-        logger.info("✅ MongoDB connection successful!")
-    except Exception as e:
-        logger.error(f"❌ MongoDB connection failed: {e}")
-        raise
+    logger.info(f"MongoDB client created (maxPoolSize={client.options.pool_options.max_pool_size})")
     
     return client
 
 
+class CounterAggregator:
+    """
+    Write-behind buffer for job counter increments and document field updates
+    
+    $inc is commutative, so increments for the same job are merged in memory; $set
+    updates for the same document are merged with later values winning. Everything
+    pending is written with one unordered bulk_write per collection, by a background
+    timer every flush_interval seconds while there is anything to write, as soon as
+    max_pending operations are buffered, and explicitly via flush() (e.g. when a job
+    finishes).
+    """
+    
+    def __init__(
+        self,
+        jobs_collection: Collection,
+        docs_collection: Collection,
+        flush_interval: float = 0.5,
+        max_pending: int = 100
+    ):
+        """
+        Initialize counter aggregator
+        
+        Args:
+            jobs_collection: Collection holding the job counter documents (ocr_jobs)
+            docs_collection: Collection holding the document records (ocr_docs)
+            flush_interval: Seconds between background flushes
+            max_pending: Buffered job + doc operations that trigger an immediate flush
+        """
+        self.jobs_collection = jobs_collection
+        self.docs_collection = docs_collection
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending_inc: Dict[ObjectId, Dict[str, int]] = {}
+        self._pending_doc_set: Dict[ObjectId, Dict[str, Any]] = {}
+        self._inc_attempts: Dict[ObjectId, int] = {}
+        self._doc_attempts: Dict[ObjectId, int] = {}
+        self._lock = threading.Lock()
+        # Serializes flushes so an older write can't land after a newer one
+        self._flush_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+    
+    def add(self, job_id: ObjectId, increments: Dict[str, int]):
+        """
+        Buffer increments for a job
+        
+        Args:
+            job_id: Job ID
+            increments: Mapping of full field name (e.g. "c_files_failed") to increment
+        """
+        with self._lock:
+            pending = self._pending_inc.setdefault(job_id, {})
+            for field, value in increments.items():
+                pending[field] = pending.get(field, 0) + value
+            flush_now = self._schedule()
+        if flush_now:
+            self.flush()
+    
+    def set_doc_fields(self, doc_id: ObjectId, fields: Dict[str, Any]):
+        """
+        Buffer a $set for a document (merged with any pending $set for it)
+        
+        Args:
+            doc_id: Document ID
+            fields: Mapping of field path to value
+        """
+        with self._lock:
+            self._pending_doc_set.setdefault(doc_id, {}).update(fields)
+            flush_now = self._schedule()
+        if flush_now:
+            self.flush()
+    
+    def _schedule(self) -> bool:
+        """
+        Arm the background flush timer if it isn't already running (lock held)
+        
+        Returns:
+            True if enough operations are buffered to flush immediately
+        """
+        if self._timer is None and not self._closed:
+            self._timer = threading.Timer(self.flush_interval, self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+        return len(self._pending_inc) + len(self._pending_doc_set) >= self.max_pending
+    
+    def _on_timer(self):
+        with self._lock:
+            self._timer = None
+        self.flush()
+    
+    def flush(self):
+        """
+        Write all pending increments and document updates to MongoDB
+        
+        Flushes are serialized: when flush() returns, every update buffered before the
+        call has been written (or dropped), including ones a concurrent flush took.
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending_inc, self._pending_inc = self._pending_inc, {}
+                pending_doc_set, self._pending_doc_set = self._pending_doc_set, {}
+            
+            if pending_doc_set:
+                self._flush_doc_sets(pending_doc_set)
+            if pending_inc:
+                self._flush_increments(pending_inc)
+    
+    def _flush_doc_sets(self, pending_doc_set: Dict[ObjectId, Dict[str, Any]]):
+        doc_ids = list(pending_doc_set)
+        try:
+            self.docs_collection.bulk_write(
+                [UpdateOne({"_id": doc_id}, {"$set": pending_doc_set[doc_id]}) for doc_id in doc_ids],
+                ordered=False
+            )
+            failed: Set[ObjectId] = set()
+        except BulkWriteError as e:
+            failed = {doc_ids[err["index"]] for err in e.details.get("writeErrors", [])}
+            logger.error(f"Failed to flush {len(failed)} of {len(doc_ids)} document updates: {e}")
+        except Exception as e:
+            # $set is idempotent, so retrying updates the server may have applied is safe
+            failed = set(doc_ids)
+            logger.error(f"Failed to flush {len(doc_ids)} document updates: {e}")
+        
+        with self._lock:
+            for doc_id, fields in pending_doc_set.items():
+                if not self._should_retry(self._doc_attempts, doc_id, doc_id in failed):
+                    continue
+                # Put the update back without clobbering newer values buffered meanwhile
+                self._pending_doc_set[doc_id] = {**fields, **self._pending_doc_set.get(doc_id, {})}
+            if failed:
+                self._schedule()
+    
+    def _flush_increments(self, pending_inc: Dict[ObjectId, Dict[str, int]]):
+        now = datetime.now(timezone.utc)
+        job_ids = list(pending_inc)
+        try:
+            self.jobs_collection.bulk_write(
+                [
+                    UpdateOne({"_id": job_id}, {"$inc": pending_inc[job_id], "$set": {"updated_at": now}})
+                    for job_id in job_ids
+                ],
+                ordered=False
+            )
+            failed: Set[ObjectId] = set()
+        except BulkWriteError as e:
+            # Unordered: every op not listed in writeErrors was applied, so only the
+            # failed ones are retried (re-adding the rest would count them twice)
+            failed = {job_ids[err["index"]] for err in e.details.get("writeErrors", [])}
+            logger.error(f"Failed to flush counters for {len(failed)} of {len(job_ids)} job(s): {e}")
+        except Exception as e:
+            # The server may have applied the write; counters are advisory, so drop
+            # them rather than risk double counting on retry
+            logger.error(f"Dropping counter increments for {len(job_ids)} job(s) after failed flush: {e}")
+            failed = set()
+        
+        with self._lock:
+            for job_id, increments in pending_inc.items():
+                if not self._should_retry(self._inc_attempts, job_id, job_id in failed):
+                    continue
+                pending = self._pending_inc.setdefault(job_id, {})
+                for field, value in increments.items():
+                    pending[field] = pending.get(field, 0) + value
+            if failed:
+                self._schedule()
+    
+    @staticmethod
+    def _should_retry(attempts: Dict[ObjectId, int], key: ObjectId, failed: bool) -> bool:
+        """
+        Track failed flushes for a buffered update (lock held)
+        
+        Args:
+            attempts: Failed-flush counts by ID
+            key: Job or document ID
+            failed: Whether the latest write for key failed
+            
+        Returns:
+            True if the update should be re-buffered; after COUNTER_FLUSH_MAX_ATTEMPTS
+            failures it is dropped with a warning
+        """
+        if not failed:
+            attempts.pop(key, None)
+            return False
+        count = attempts.get(key, 0) + 1
+        if count >= COUNTER_FLUSH_MAX_ATTEMPTS:
+            attempts.pop(key, None)
+            logger.warning(f"Dropping buffered update for {key} after {count} failed flushes")
+            return False
+        attempts[key] = count
+        return True
+    
+    def close(self):
+        """Stop the background timer and flush everything still pending"""
+        with self._lock:
+            self._closed = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self.flush()
+
+
 class MongoDBService:
     """Service for MongoDB operations related to OCR progress tracking"""
     
+    # Process-wide shared instance (see get_service)
+    _instance: Optional["MongoDBService"] = None
+    _instance_lock = threading.Lock()
+    
+    # Set once index creation has fully succeeded; it then only needs to run once per process
+    _indexes_ensured: bool = False
+    
+    @classmethod
+    def get_service(
+        cls,
+        uri: Optional[str] = None,
+        database_name: Optional[str] = None
+    ) -> "MongoDBService":
+        """
+        Get the process-wide MongoDB service, creating it on first use
+        
+        Reusing one instance shares a single MongoClient (and its connection pool)
+        instead of reconnecting and re-checking indexes for every caller.
+        
+        Args:
+            uri: Optional MongoDB connection URI (only used on first creation)
+            database_name: Database name (only used on first creation)
+            
+        Returns:
+            MongoDBService instance
+        """
+        if cls._instance is None:
+            # Sync dependencies run on the threadpool; concurrent first requests must not
+            # each build a client (the loser's CounterAggregator would never be flushed)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(uri=uri, database_name=database_name)
+        return cls._instance
+    
     def __init__(self, uri: Optional[str] = None, database_name: Optional[str] = None):
         """
         Initialize MongoDB service
@@ -99,24 +418,41 @@ class MongoDBService:
         """Connect to MongoDB and initialize database"""
         try:
             self.client = get_mongo_client(self.uri)
-            self.db = self.client[self.database_name]
+            self.db = self.client.get_database(self.database_name, codec_options=_CODEC)
+            # Progress counters are advisory (recomputed on rerun), so their writes
+            # skip replication/journal acknowledgement
+            self._jobs_fast = self.db.ocr_jobs.with_options(write_concern=WriteConcern(w=1, j=False))
+            self._counter_aggregator = CounterAggregator(self._jobs_fast, self.db.ocr_docs)
+            # Read-only handle for lookups that tolerate slight staleness (worst case
+            # a doc is re-embedded); keeps those reads off the write-heavy primary
+            self._docs_ro = self.db.ocr_docs.with_options(
+                read_preference=ReadPreference.SECONDARY_PREFERRED,
+                read_concern=ReadConcern("local")
+            )
             logger.info(f"Connected to MongoDB database: {self.database_name}")
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
             raise
     
     def _create_indexes(self):
-        """Create necessary indexes for OCR collections"""
+        """Create necessary indexes for OCR collections (once per process)"""
+        if MongoDBService._indexes_ensured:
+            return
+        
+        ok = True
         try:
-            # Indexes for ocr_jobs collection
-            self.db.ocr_jobs.create_index([("status", 1)], background=True)
-            self.db.ocr_jobs.create_index([("created_at", -1)], background=True)
-            
-            # Unique index on dataset_name to ensure only one job per dataset
+            # Indexes for ocr_jobs collection, including a unique index on dataset_name
+            # to ensure only one job per dataset
             # Note: If duplicates exist, this will fail - clean up duplicates first
             try:
-                self.db.ocr_jobs.create_index([("dataset_name", 1)], unique=True, background=True)
-                logger.info("Created unique index on ocr_jobs.dataset_name")
+                # (status, created_at) serves "jobs with status X, newest first"; the
+                # unique dataset_name index already pins one job per dataset, so no
+                # (dataset_name, created_at) compound is needed
+                self.db.ocr_jobs.create_indexes([
+                    IndexModel([("status", ASCENDING), ("created_at", DESCENDING)]),
+                    IndexModel([("dataset_name", ASCENDING)], unique=True)
+                ])
+                logger.info("Created/verified indexes on ocr_jobs")
             except Exception as e:
                 if "duplicate key" in str(e).lower() or "E11000" in str(e):
                     logger.error(
@@ -125,22 +461,27 @@ class MongoDBService:
                     )
                     raise
                 else:
-                    logger.warning(f"Index on dataset_name may already exist: {e}")
+                    logger.warning(f"Indexes on ocr_jobs may already exist: {e}")
+                    ok = False
             
-            # Indexes for ocr_docs collection
-            self.db.ocr_docs.create_index([("job_id", 1)], background=True)
-            self.db.ocr_docs.create_index([("status", 1)], background=True)
-            self.db.ocr_docs.create_index([("source_drive_file_id", 1)], background=True)
+            ok = self._create_job_lifecycle_indexes() and ok
             
-            # Unique compound index on dataset_name + source_drive_file_id
+            # Indexes for ocr_docs collection, including a unique compound index on
+            # dataset_name + source_drive_file_id
             # Note: If duplicates exist, this will fail - clean up duplicates first
             try:
-                self.db.ocr_docs.create_index(
-                    [("dataset_name", 1), ("source_drive_file_id", 1)], 
-                    unique=True,
-                    background=True
-                )
-                logger.info("Created unique compound index on ocr_docs (dataset_name, source_drive_file_id)")
+                # Per-job doc queries filter by status or sort by created_at; both
+                # compounds also serve job_id-only lookups via their prefix
+                self.db.ocr_docs.create_indexes([
+                    IndexModel([("job_id", ASCENDING), ("status", ASCENDING)]),
+                    IndexModel([("job_id", ASCENDING), ("created_at", DESCENDING)]),
+                    IndexModel(
+                        [("dataset_name", ASCENDING), ("source_drive_file_id", ASCENDING)],
+                        unique=True
+                    ),
+                    IndexModel(_EMBEDDED_LOOKUP_INDEX)
+                ])
+                logger.info("Created/verified indexes on ocr_docs")
             except Exception as e:
                 if "duplicate key" in str(e).lower() or "E11000" in str(e):
                     logger.error(
@@ -149,18 +490,144 @@ class MongoDBService:
                     )
                     raise
                 else:
-                    logger.warning(f"Compound index may already exist: {e}")
+                    logger.warning(f"Indexes on ocr_docs may already exist: {e}")
+                    ok = False
+            
+            # One record per (document, page, chunk); the unique index makes a
+            # re-run of insert_chunks for the same document idempotent
+            try:
+                self.db.ocr_chunks.create_indexes([
+                    IndexModel(
+                        [("ocr_doc_id", ASCENDING), ("page_index", ASCENDING), ("chunk_index", ASCENDING)],
+                        unique=True
+                    ),
+                    IndexModel([("job_id", ASCENDING)])
+                ])
+                logger.info("Created/verified indexes on ocr_chunks")
+            except Exception as e:
+                logger.warning(f"Indexes on ocr_chunks may already exist: {e}")
+                ok = False
+            
+            ok = self._create_dataset_partial_indexes() and ok
+            
+            # Single-field indexes superseded by the compounds above (every docs query
+            # on source_drive_file_id also filters on dataset_name)
+            self._drop_legacy_indexes(self.db.ocr_jobs, ["status_1", "created_at_-1"])
+            self._drop_legacy_indexes(
+                self.db.ocr_docs,
+                ["job_id_1", "status_1", "source_drive_file_id_1"]
+            )
             
             logger.info("MongoDB indexes created/verified successfully")
         except Exception as e:
             logger.warning(f"Failed to create some indexes (may already exist or duplicates present): {e}")
+            ok = False
+        
+        # Only skip later checks once everything succeeded, so a transient failure
+        # (e.g. a primary election at startup) is retried by the next instance
+        MongoDBService._indexes_ensured = ok
+    
+    def _create_job_lifecycle_indexes(self) -> bool:
+        """
+        Create the partial indexes that keep ocr_jobs queries on live jobs
+        
+        A TTL index expires finished jobs OCR_JOB_TTL_DAYS after their last update;
+        a partial index on running jobs stays sized to the live-job count. Finished
+        ocr_docs and ocr_chunks records get the same retention so nothing is left
+        behind without its job.
+        
+        Returns:
+            True if the indexes were created or already existed
+        """
+        try:
+            index_models = [
+                IndexModel(
+                    [("status", ASCENDING)],
+                    partialFilterExpression={"status": "running"},
+                    name="status_running"
+                )
+            ]
+            if settings.OCR_JOB_TTL_DAYS > 0:
+                ttl_seconds = settings.OCR_JOB_TTL_DAYS * 86400
+                index_models.append(IndexModel(
+                    [("updated_at", ASCENDING)],
+                    expireAfterSeconds=ttl_seconds,
+                    partialFilterExpression={"status": {"$in": TERMINAL_JOB_STATUSES}},
+                    name="updated_at_ttl_finished"
+                ))
+                self.db.ocr_docs.create_indexes([IndexModel(
+                    [("updated_at", ASCENDING)],
+                    expireAfterSeconds=ttl_seconds,
+                    partialFilterExpression={"status": {"$in": TERMINAL_DOC_STATUSES}},
+                    name="updated_at_ttl_finished"
+                )])
+                # Chunks are (re)written when their document is processed, so they never
+                # outlive it
+                self.db.ocr_chunks.create_indexes([IndexModel(
+                    [("created_at", ASCENDING)],
+                    expireAfterSeconds=ttl_seconds,
+                    name="created_at_ttl"
+                )])
+            else:
+                self._drop_legacy_indexes(self.db.ocr_jobs, ["updated_at_ttl_finished"])
+                self._drop_legacy_indexes(self.db.ocr_docs, ["updated_at_ttl_finished"])
+                self._drop_legacy_indexes(self.db.ocr_chunks, ["created_at_ttl"])
+            
+            self.db.ocr_jobs.create_indexes(index_models)
+            logger.info("Created/verified lifecycle indexes on ocr_jobs, ocr_docs and ocr_chunks")
+            return True
+        except Exception as e:
+            # e.g. IndexOptionsConflict after OCR_JOB_TTL_DAYS changed; use collMod to update
+            logger.warning(f"Failed to create lifecycle indexes: {e}")
+            return False
+    
+    def _drop_legacy_indexes(self, collection: Collection, index_names: List[str]):
+        """Best-effort removal of indexes that are no longer created"""
+        for index_name in index_names:
+            try:
+                collection.drop_index(index_name)
+                logger.info(f"Dropped redundant index {collection.name}.{index_name}")
+            except OperationFailure:
+                pass
+    
+    def _create_dataset_partial_indexes(self) -> bool:
+        """
+        Create per-dataset partial indexes on ocr_docs.source_drive_file_id
+        
+        Only the largest datasets known at startup (by c_files_discovered) get one;
+        smaller datasets are served by the global compound indexes.
+        
+        Returns:
+            True if the indexes were created or already existed
+        """
+        try:
+            largest_jobs = self.db.ocr_jobs.find(
+                {},
+                {"dataset_name": 1, "_id": 0}
+            ).sort(f"{COUNTER_PREFIX}files_discovered", DESCENDING).limit(PARTIAL_INDEX_TOP_DATASETS)
+            
+            index_models = [
+                IndexModel(
+                    [("source_drive_file_id", ASCENDING)],
+                    partialFilterExpression={"dataset_name": job["dataset_name"]},
+                    name=f"sdfid_{job['dataset_name']}"
+                )
+                for job in largest_jobs
+            ]
+            if index_models:
+                self.db.ocr_docs.create_indexes(index_models)
+                logger.info(f"Created/verified partial indexes for {len(index_models)} largest dataset(s)")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to create per-dataset partial indexes: {e}")
+            return False
     
     def create_job(
         self,
         dataset_name: str,
         input_folder_id: str,
         output_folder_id: str
-    ) -> str:
+    ) -> ObjectId:
         """
         Create or update an OCR job record for a dataset (idempotent by dataset_name)
         
@@ -173,109 +640,70 @@ class MongoDBService:
             output_folder_id: Google Drive output folder ID
             
         Returns:
-            Job ID (MongoDB ObjectId as string)
+            Job ID (MongoDB ObjectId)
         """
         now = datetime.now(timezone.utc)
         
-        # Check if job already exists for this dataset
-        existing_job = self.db.ocr_jobs.find_one({"dataset_name": dataset_name})
-        
-        if existing_job:
-            # Update existing job - reset status and counters for new run
-            # Preserve created_at to track when dataset was first processed
-            job_id = str(existing_job["_id"])
-            logger.info(f"Found existing job: {job_id} for dataset: {dataset_name}, updating for new run")
-            
-            update = {
+        # Single atomic upsert: status, folder IDs and counters are reset for the new run,
+        # created_at is preserved to track when the dataset was first processed
+        job = self.db.ocr_jobs.find_one_and_update(
+            {"dataset_name": dataset_name},
+            {
                 "$set": {
                     "input_folder_id": input_folder_id,
                     "output_folder_id": output_folder_id,
                     "status": "running",
-                    "counters": {
-                        "files_discovered": 0,
-                        "files_processed": 0,
-                        "files_failed": 0,
-                        "pages_processed": 0,
-                        "pages_without_text": 0,
-                        "chunks_emitted": 0,
-                        "lang_undetected_count": 0
-                    },
-                    "embedding_counters": {
-                        "files_embedded": 0,
-                        "embeddings_stored": 0,
-                        "files_embedding_failed": 0
-                    },
+                    # Int64 zeros: counters start at their final 8-byte width, so $inc
+                    # never grows the document
+                    **{f"{COUNTER_PREFIX}{key}": Int64(0) for key in JOB_COUNTER_FIELDS},
+                    **{f"{EMBEDDING_COUNTER_PREFIX}{key}": Int64(0) for key in JOB_EMBEDDING_COUNTER_FIELDS},
                     "updated_at": now
-                }
-            }
-            
-            # Preserve created_at if it exists, otherwise set it
-            if "created_at" not in existing_job:
-                update["$set"]["created_at"] = now
-            
-            self.db.ocr_jobs.update_one(
-                {"_id": ObjectId(job_id) if isinstance(job_id, str) else existing_job["_id"]},
-                update
-            )
-            
-            return job_id
-        else:
-            # Create new job
-            job = {
-                "dataset_name": dataset_name,
-                "input_folder_id": input_folder_id,
-                "output_folder_id": output_folder_id,
-                "status": "running",
-                "counters": {
-                    "files_discovered": 0,
-                    "files_processed": 0,
-                    "files_failed": 0,
-                    "pages_processed": 0,
-                    "pages_without_text": 0,
-                    "chunks_emitted": 0,
-                    "lang_undetected_count": 0
                 },
-                "embedding_counters": {
-                    "files_embedded": 0,
-                    "embeddings_stored": 0,
-                    "files_embedding_failed": 0
+                # Drop the legacy nested counter documents when a job is rerun
+                "$unset": {
+                    "counters": "",
+                    "embedding_counters": ""
                 },
-                "created_at": now,
-                "updated_at": now,
-                "tz": "Asia/Kolkata"
-            }
-            
-            result = self.db.ocr_jobs.insert_one(job)
-            job_id = str(result.inserted_id)
-            logger.info(f"Created new OCR job: {job_id} for dataset: {dataset_name}")
-            return job_id
+                "$setOnInsert": {
+                    "created_at": now,
+                    "tz": "Asia/Kolkata"
+                }
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+            projection=_ID_ONLY
+        )
+        
+        job_id = job["_id"]
+        logger.info(f"Created/updated OCR job: {job_id} for dataset: {dataset_name}")
+        return job_id
     
     def update_job_counters(
         self,
-        job_id: str,
+        job_id: ObjectId,
         counters: Dict[str, int]
     ):
         """
         Update job counters
         
+        Increments are buffered in memory and written by the counter aggregator;
+        finish_job and close flush them.
+        
         Args:
             job_id: Job ID
             counters: Dictionary with counter updates (incremental values)
         """
-        update = {"$inc": {}, "$set": {"updated_at": datetime.now(timezone.utc)}}
-        
-        for key, value in counters.items():
-            update["$inc"][f"counters.{key}"] = value
-        
-        self.db.ocr_jobs.update_one(
-            {"_id": ObjectId(job_id) if isinstance(job_id, str) else job_id},
-            update
+        self._counter_aggregator.add(
+            job_id,
+            {f"{COUNTER_PREFIX}{key}": value for key, value in counters.items()}
         )
     
     def finish_job(
         self,
-        job_id: str,
-        status: str
+        job_id: ObjectId,
+        status: str,
+        *,
+        now: Optional[datetime] = None
     ):
         """
         Finish a job by updating its status
@@ -283,13 +711,17 @@ class MongoDBService:
         Args:
             job_id: Job ID
             status: Final status (completed|completed_with_errors|failed)
+            now: Optional timestamp (defaults to current UTC time)
         """
+        # Make sure buffered counters and doc updates land before the job is reported finished
+        self._counter_aggregator.flush()
+        
         self.db.ocr_jobs.update_one(
-            {"_id": ObjectId(job_id) if isinstance(job_id, str) else job_id},
+            {"_id": job_id},
             {
                 "$set": {
                     "status": status,
-                    "updated_at": datetime.now(timezone.utc)
+                    "updated_at": now or datetime.now(timezone.utc)
                 }
             }
         )
@@ -297,12 +729,12 @@ class MongoDBService:
     
     def create_doc(
         self,
-        job_id: str,
+        job_id: ObjectId,
         dataset_name: str,
         source_drive_file_id: str,
         source_path: str,
         source_url: Optional[str] = None
-    ) -> str:
+    ) -> ObjectId:
         """
         Create or update a document record (idempotent by dataset_name + source_drive_file_id)
         
@@ -317,67 +749,45 @@ class MongoDBService:
             source_url: Optional Google Drive public view URL
             
         Returns:
-            Document ID (MongoDB ObjectId as string)
+            Document ID (MongoDB ObjectId)
         """
-        now = datetime.now(timezone.utc)
+        doc = self.db.ocr_docs.find_one_and_update(
+            {
+                "dataset_name": dataset_name,
+                "source_drive_file_id": source_drive_file_id
+            },
+            self._doc_upsert_update(
+                job_id,
+                source_path,
+                source_url,
+                datetime.now(timezone.utc)
+            ),
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+            projection=_ID_ONLY
+        )
         
-        # Check if document already exists for this file in this dataset
-        existing_doc = self.db.ocr_docs.find_one({
-            "dataset_name": dataset_name,
-            "source_drive_file_id": source_drive_file_id
-        })
-        
-        if existing_doc:
-            # Update existing document - reset status and counts for new run
-            # Preserve created_at to track when document was first processed
-            doc_id = str(existing_doc["_id"])
-            logger.debug(f"Found existing doc: {doc_id} for file: {source_path}, updating for new run")
-            
-            update = {
-                "$set": {
-                    "job_id": job_id,
-                    "source_path": source_path,
-                    "status": "queued",
-                    "message": "",
-                    "counts": {
-                        "pages_total": 0,
-                        "pages_without_text": 0,
-                        "chunks_emitted": 0,
-                        "lang_undetected_count": 0
-                    },
-                    # Reset embedding status for new run
-                    "embedded": False,
-                    "embeddings_count": None,
-                    "pinecone_index": None,
-                    "embedded_at": None,
-                    "updated_at": now
-                }
-            }
-            
-            # Update source_url if provided
-            if source_url:
-                update["$set"]["source_url"] = source_url
-            
-            # Preserve created_at if it exists, otherwise set it
-            if "created_at" not in existing_doc:
-                update["$set"]["created_at"] = now
-            
-            self.db.ocr_docs.update_one(
-                {"_id": ObjectId(doc_id) if isinstance(doc_id, str) else existing_doc["_id"]},
-                update
-            )
-            
-            return doc_id
-        else:
-            # Create new document
-            doc = {
+        doc_id = doc["_id"]
+        logger.debug(f"Created/updated OCR doc: {doc_id} for file: {source_path}")
+        return doc_id
+    
+    def _doc_upsert_update(
+        self,
+        job_id: ObjectId,
+        source_path: str,
+        source_url: Optional[str],
+        now: datetime
+    ) -> Dict[str, Any]:
+        """
+        Build the upsert update for a document record starting a new run
+        
+        Status, counts and embedding state are reset on every run; created_at, tz and
+        output fields are only written when the document is first inserted.
+        """
+        update = {
+            "$set": {
                 "job_id": job_id,
-                "dataset_name": dataset_name,
-                "source_drive_file_id": source_drive_file_id,
                 "source_path": source_path,
-                "source_url": source_url,
-                "output_drive_file_id": None,
-                "output_path": None,
                 "status": "queued",
                 "message": "",
                 "counts": {
@@ -386,93 +796,282 @@ class MongoDBService:
                     "chunks_emitted": 0,
                     "lang_undetected_count": 0
                 },
+                # Reset embedding status for new run
                 "embedded": False,
                 "embeddings_count": None,
                 "pinecone_index": None,
                 "embedded_at": None,
+                "updated_at": now
+            },
+            "$setOnInsert": {
+                "output_drive_file_id": None,
+                "output_path": None,
                 "created_at": now,
-                "updated_at": now,
                 "tz": "Asia/Kolkata"
             }
+        }
+        
+        # Only overwrite source_url when one is provided
+        if source_url:
+            update["$set"]["source_url"] = source_url
+        else:
+            update["$setOnInsert"]["source_url"] = None
+        
+        return update
+    
+    def create_docs_bulk(
+        self,
+        job_id: ObjectId,
+        dataset_name: str,
+        docs: List[Dict[str, Any]],
+        batch_size: int = 500
+    ) -> Dict[str, ObjectId]:
+        """
+        Create or update many document records with one bulk write per batch
+        
+        Same semantics as create_doc, but each batch is a single unordered bulk_write of
+        upserts instead of two round-trips per document.
+        
+        Args:
+            job_id: Parent job ID
+            dataset_name: Dataset name
+            docs: Dictionaries with source_drive_file_id, source_path and optional source_url
+            batch_size: Upserts per bulk_write call
+            
+        Returns:
+            Mapping of source_drive_file_id to document ID (MongoDB ObjectId)
+        """
+        now = datetime.now(timezone.utc)
+        doc_ids: Dict[str, ObjectId] = {}
+        
+        for start in range(0, len(docs), batch_size):
+            batch = docs[start:start + batch_size]
+            ops = [
+                UpdateOne(
+                    {
+                        "dataset_name": dataset_name,
+                        "source_drive_file_id": doc["source_drive_file_id"]
+                    },
+                    self._doc_upsert_update(
+                        job_id,
+                        doc["source_path"],
+                        doc.get("source_url"),
+                        now
+                    ),
+                    upsert=True
+                )
+                for doc in batch
+            ]
+            
+            try:
+                upserted_ids = self.db.ocr_docs.bulk_write(ops, ordered=False).upserted_ids
+            except BulkWriteError as e:
+                # A concurrent run may have inserted some of these docs first; the
+                # follow-up find resolves their IDs. Anything else is a real failure.
+                if any(err.get("code") != 11000 for err in e.details.get("writeErrors", [])):
+                    raise
+                upserted_ids = {
+                    item["index"]: item["_id"] for item in e.details.get("upserted", [])
+                }
+            
+            for index, inserted_id in upserted_ids.items():
+                doc_ids[batch[index]["source_drive_file_id"]] = inserted_id
             
-            result = self.db.ocr_docs.insert_one(doc)
-            doc_id = str(result.inserted_id)
-            logger.debug(f"Created new OCR doc: {doc_id} for file: {source_path}")
-            return doc_id
+            # Existing docs were matched rather than inserted; look up their IDs
+            # (on the primary, so the upserts above are always visible)
+            matched_file_ids = [
+                doc["source_drive_file_id"] for index, doc in enumerate(batch)
+                if index not in upserted_ids
+            ]
+            if matched_file_ids:
+                cursor = self.db.ocr_docs.find(
+                    {
+                        "dataset_name": dataset_name,
+                        "source_drive_file_id": {"$in": matched_file_ids}
+                    },
+                    _DOC_ID_BY_FILE
+                )
+                for doc in cursor:
+                    doc_ids[doc["source_drive_file_id"]] = doc["_id"]
+            
+            logger.debug(
+                f"Upserted {len(batch)} OCR docs for dataset: {dataset_name} "
+                f"({len(upserted_ids)} new)"
+            )
+        
+        return doc_ids
+    
+    def reset_docs_for_job(self, job_id: ObjectId) -> int:
+        """
+        Re-queue every document of a job with a single server-side update
+        
+        Applies the same reset as a new run's create_doc upsert (status, counts and
+        embedding state) to all matched docs at once. Uses the pipeline form of
+        update_many so updated_at comes from the server's $$NOW.
+        
+        Args:
+            job_id: Job ID
+            
+        Returns:
+            Number of documents reset
+        """
+        result = self.db.ocr_docs.update_many(
+            {"job_id": job_id},
+            [{
+                "$set": {
+                    "status": "queued",
+                    "message": "",
+                    "counts": {
+                        "pages_total": 0,
+                        "pages_without_text": 0,
+                        "chunks_emitted": 0,
+                        "lang_undetected_count": 0
+                    },
+                    "embedded": False,
+                    "embeddings_count": None,
+                    "pinecone_index": None,
+                    "embedded_at": None,
+                    "updated_at": "$$NOW"
+                }
+            }]
+        )
+        logger.info(f"Reset {result.modified_count} OCR docs for job: {job_id}")
+        return result.modified_count
+    
+    def update_doc(
+        self,
+        doc_id: ObjectId,
+        status: Optional[str] = None,
+        message: Optional[str] = None,
+        output_drive_file_id: Optional[str] = None,
+        output_path: Optional[str] = None,
+        counts: Optional[Dict[str, int]] = None,
+        *,
+        now: Optional[datetime] = None,
+        **extra: Any
+    ):
+        """
+        Update several document fields with a single write
+        
+        Only arguments that are not None are set, so one call can cover a whole
+        state transition (status + output + counts) instead of one write each. The
+        $set is buffered by the write-behind aggregator (merged with any pending
+        update for the same doc) and written in the next bulk flush; finish_job and
+        close flush it.
+        
+        Args:
+            doc_id: Document ID
+            status: New status (queued|processing|ok|skipped|failed)
+            message: Status message
+            output_drive_file_id: Google Drive output file ID
+            output_path: Path to output file
+            counts: Count values, set as counts.<key>
+            now: Optional timestamp shared by a batch of updates (defaults to current UTC time)
+            **extra: Any other top-level fields to set
+        """
+        self._counter_aggregator.set_doc_fields(
+            doc_id,
+            self._doc_update_set(
+                now,
+                counts,
+                status=status,
+                message=message,
+                output_drive_file_id=output_drive_file_id,
+                output_path=output_path,
+                **extra
+            )
+        )
+    
+    def _doc_update_set(
+        self,
+        now: Optional[datetime],
+        counts: Optional[Dict[str, int]],
+        **fields: Any
+    ) -> Dict[str, Any]:
+        """Build the $set document for update_doc, skipping fields that are None"""
+        update_set = {key: value for key, value in fields.items() if value is not None}
+        
+        if counts:
+            for key, value in counts.items():
+                update_set[f"counts.{key}"] = value
+        
+        update_set["updated_at"] = now or datetime.now(timezone.utc)
+        return update_set
     
     def update_doc_status(
         self,
-        doc_id: str,
+        doc_id: ObjectId,
         status: str,
-        message: str = ""
+        message: str = "",
+        *,
+        now: Optional[datetime] = None
     ):
         """
         Update document status
         
+        Deprecated: use update_doc to combine updates into one write.
+        
         Args:
             doc_id: Document ID
             status: New status (queued|processing|ok|skipped|failed)
             message: Optional status message
+            now: Optional timestamp shared by a batch of updates (defaults to current UTC time)
         """
-        self.db.ocr_docs.update_one(
-            {"_id": ObjectId(doc_id) if isinstance(doc_id, str) else doc_id},
-            {
-                "$set": {
-                    "status": status,
-                    "message": message,
-                    "updated_at": datetime.now(timezone.utc)
-                }
-            }
-        )
+        self.update_doc(doc_id, status=status, message=message, now=now)
     
     def update_doc_output(
         self,
-        doc_id: str,
+        doc_id: ObjectId,
         output_drive_file_id: str,
-        output_path: str
+        output_path: str,
+        *,
+        now: Optional[datetime] = None
     ):
         """
         Update document with output file information
         
+        Deprecated: use update_doc to combine updates into one write.
+        
         Args:
             doc_id: Document ID
             output_drive_file_id: Google Drive output file ID
             output_path: Path to output file
+            now: Optional timestamp shared by a batch of updates (defaults to current UTC time)
         """
-        self.db.ocr_docs.update_one(
-            {"_id": ObjectId(doc_id) if isinstance(doc_id, str) else doc_id},
-            {
-                "$set": {
-                    "output_drive_file_id": output_drive_file_id,
-                    "output_path": output_path,
-                    "updated_at": datetime.now(timezone.utc)
-                }
-            }
+        self.update_doc(
+            doc_id,
+            output_drive_file_id=output_drive_file_id,
+            output_path=output_path,
+            now=now
         )
     
     def update_doc_counts(
         self,
-        doc_id: str,
-        counts: Dict[str, int]
+        doc_id: ObjectId,
+        counts: Dict[str, int],
+        *,
+        now: Optional[datetime] = None
     ):
         """
         Update document counts
         
+        Deprecated: use update_doc to combine updates into one write.
+        
         Args:
             doc_id: Document ID
             counts: Dictionary with count updates
+            now: Optional timestamp shared by a batch of updates (defaults to current UTC time)
         """
-        update = {"$set": {"updated_at": datetime.now(timezone.utc)}}
-        
-        for key, value in counts.items():
-            update["$set"][f"counts.{key}"] = value
-        
-        self.db.ocr_docs.update_one(
-            {"_id": ObjectId(doc_id) if isinstance(doc_id, str) else doc_id},
-            update
-        )
+        self.update_doc(doc_id, counts=counts, now=now)
     
-    def mark_doc_embedded(self, doc_id: str, embeddings_count: int, pinecone_index: str):
+    def mark_doc_embedded(
+        self,
+        doc_id: ObjectId,
+        embeddings_count: int,
+        pinecone_index: str,
+        *,
+        now: Optional[datetime] = None
+    ):
         """
         Mark a document as embedded in Pinecone
         
@@ -480,24 +1079,113 @@ class MongoDBService:
             doc_id: Document ID
             embeddings_count: Number of embeddings stored
             pinecone_index: Pinecone index name
+            now: Optional timestamp shared by a batch of updates (defaults to current UTC time)
         """
+        now = now or datetime.now(timezone.utc)
         self.db.ocr_docs.update_one(
-            {"_id": ObjectId(doc_id) if isinstance(doc_id, str) else doc_id},
+            {"_id": doc_id},
             {
                 "$set": {
                     "embedded": True,
                     "embeddings_count": embeddings_count,
                     "pinecone_index": pinecone_index,
-                    "embedded_at": datetime.now(timezone.utc),
-                    "updated_at": datetime.now(timezone.utc)
+                    "embedded_at": now,
+                    "updated_at": now
                 }
             }
         )
     
+    def insert_chunks(
+        self,
+        doc_id: ObjectId,
+        job_id: ObjectId,
+        chunks: Iterable[Dict[str, Any]],
+        batch_size: int = CHUNK_INSERT_BATCH_SIZE
+    ) -> int:
+        """
+        Store the chunk records of a document in ocr_chunks
+        
+        Previous chunks of the document are replaced; new ones are written with one
+        unordered insert_many per batch. Duplicates (e.g. from a concurrent run of the
+        same document) are skipped.
+        
+        Args:
+            doc_id: Document ID the chunks belong to
+            job_id: Parent job ID
+            chunks: Chunk records (as written to the OCR JSON output); may be a lazy
+                iterator, which is consumed one batch at a time
+            batch_size: Records per insert_many call
+            
+        Returns:
+            Number of chunk records inserted
+        """
+        now = datetime.now(timezone.utc)
+        self.db.ocr_chunks.delete_many({"ocr_doc_id": doc_id})
+        
+        inserted = 0
+        chunk_iter = iter(chunks)
+        while True:
+            records = [
+                {**chunk, "ocr_doc_id": doc_id, "job_id": job_id, "created_at": now}
+                for chunk in islice(chunk_iter, batch_size)
+            ]
+            if not records:
+                break
+            try:
+                inserted += len(self.db.ocr_chunks.insert_many(records, ordered=False).inserted_ids)
+            except BulkWriteError as e:
+                if any(err.get("code") != 11000 for err in e.details.get("writeErrors", [])):
+                    raise
+                inserted += e.details.get("nInserted", 0)
+        
+        logger.debug(f"Stored {inserted} chunks for OCR doc: {doc_id}")
+        return inserted
+    
+    def filter_unembedded(
+        self,
+        ids: List[str],
+        dataset_name: str,
+        batch_size: int = 1000
+    ) -> Set[str]:
+        """
+        Find which of the given source files have already been embedded
+        
+        Issues one covered index query per batch of IDs instead of a find_one per file;
+        callers skip the returned IDs and embed the rest.
+        
+        Args:
+            ids: Google Drive source file IDs
+            dataset_name: Dataset name
+            batch_size: IDs per $in query (keeps the query document well under BSON limits)
+            
+        Returns:
+            Set of source_drive_file_id values that are already embedded
+        """
+        embedded_ids: Set[str] = set()
+        # A hint naming a missing index fails the query, so only pass it once the
+        # indexes are known to exist; otherwise let the planner choose
+        hint = _EMBEDDED_LOOKUP_INDEX if MongoDBService._indexes_ensured else None
+        
+        for start in range(0, len(ids), batch_size):
+            cursor = self._docs_ro.find(
+                {
+                    "dataset_name": dataset_name,
+                    "source_drive_file_id": {"$in": ids[start:start + batch_size]},
+                    "embedded": True
+                },
+                _FILE_ID_ONLY,
+                hint=hint
+            )
+            embedded_ids.update(doc["source_drive_file_id"] for doc in cursor)
+        
+        return embedded_ids
+    
     def is_doc_embedded(self, source_drive_file_id: str, dataset_name: str) -> bool:
         """
         Check if a document has already been embedded
         
+        Deprecated: use filter_unembedded to check many files in one query.
+        
         Args:
             source_drive_file_id: Google Drive source file ID
             dataset_name: Dataset name
@@ -505,40 +1193,98 @@ class MongoDBService:
         Returns:
             True if document is already embedded, False otherwise
         """
-        doc = self.db.ocr_docs.find_one(
-            {
-                "source_drive_file_id": source_drive_file_id,
-                "dataset_name": dataset_name,
-                "embedded": True
-            }
-        )
-        return doc is not None
+        return source_drive_file_id in self.filter_unembedded([source_drive_file_id], dataset_name)
     
     def update_job_embedding_counters(
         self,
-        job_id: str,
+        job_id: ObjectId,
         counters: Dict[str, int]
     ):
         """
         Update job counters for embedding operations
         
+        Increments are buffered in memory and written by the counter aggregator;
+        finish_job and close flush them.
+        
         Args:
             job_id: Job ID
             counters: Dictionary with counter updates (incremental values)
         """
-        update = {"$inc": {}, "$set": {"updated_at": datetime.now(timezone.utc)}}
+        self._counter_aggregator.add(
+            job_id,
+            {f"{EMBEDDING_COUNTER_PREFIX}{key}": value for key, value in counters.items()}
+        )
+    
+    def parallel_find(
+        self,
+        filter: Dict[str, Any],
+        projection: Optional[Dict[str, Any]] = None,
+        chunks: int = 8,
+        collection_name: str = "ocr_docs"
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a large find as parallel _id-range queries
         
-        for key, value in counters.items():
-            update["$inc"][f"embedding_counters.{key}"] = value
+        Chunk boundaries are computed with a $bucketAuto on _id, then each range is
+        fetched on its own worker thread (and pooled connection). Intended for
+        admin/reporting scans over a whole dataset, where a single cursor is limited by
+        one connection's throughput.
         
-        self.db.ocr_jobs.update_one(
-            {"_id": ObjectId(job_id) if isinstance(job_id, str) else job_id},
-            update
+        Args:
+            filter: Query filter
+            projection: Optional projection
+            chunks: Number of _id ranges / worker threads
+            collection_name: Collection to scan
+            
+        Returns:
+            Matching documents, ordered by _id range
+        """
+        collection = self.db[collection_name].with_options(
+            read_preference=ReadPreference.SECONDARY_PREFERRED,
+            read_concern=ReadConcern("local")
         )
+        buckets = list(collection.aggregate([
+            {"$match": filter},
+            {"$bucketAuto": {"groupBy": "$_id", "buckets": chunks}}
+        ]))
+        if not buckets:
+            return []
+        
+        def fetch_range(index: int) -> List[Dict[str, Any]]:
+            bounds = buckets[index]["_id"]
+            # $bucketAuto upper bounds are exclusive except for the last bucket
+            upper_op = "$lte" if index == len(buckets) - 1 else "$lt"
+            range_filter = {"$and": [
+                filter,
+                {"_id": {"$gte": bounds["min"], upper_op: bounds["max"]}}
+            ]}
+            return list(collection.find(range_filter, projection))
+        
+        with ThreadPoolExecutor(max_workers=len(buckets)) as executor:
+            results = executor.map(fetch_range, range(len(buckets)))
+            return [doc for chunk in results for doc in chunk]
+    
+    def healthcheck(self) -> bool:
+        """
+        Ping the MongoDB server
+        
+        Returns:
+            True if the server responded, False otherwise
+        """
+        try:
+            self.client.admin.command("ping")
+            return True
+        except Exception as e:
+            logger.error(f"❌ MongoDB ping failed: {e}")
+            return False
     
     def close(self):
-        """Close MongoDB connection"""
+        """Flush buffered counters and close MongoDB connection"""
         if self.client:
+            self._counter_aggregator.close()
             self.client.close()
             logger.info("Closed MongoDB connection")
+        with MongoDBService._instance_lock:
+            if MongoDBService._instance is self:
+                MongoDBService._instance = None
 
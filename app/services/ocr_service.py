@@ -5,14 +5,182 @@ import io
 import os
 import unicodedata
 import re
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 import fitz  # PyMuPDF
+from charset_normalizer import from_bytes
 from docx import Document
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langdetect import detect, detect_langs, LangDetectException
+from langdetect import DetectorFactory, detect, detect_langs, LangDetectException
 from slugify import slugify
 from loguru import logger
-import regex
+
+
+# Whitespace runs that normalize_text rewrites, matched in a single pass (it runs
+# once per page): a newline group with any surrounding spaces/tabs, or a horizontal
+# run that isn't already a single space
+_RE_WS = re.compile(r'[ \t]*\n(?:[ \t]*\n)*[ \t]*|\t[ \t]*| [ \t]+')
+
+# PyMuPDF text flags: the defaults minus TEXT_PRESERVE_WHITESPACE (tabs and other
+# whitespace come out as plain spaces), plus TEXT_DEHYPHENATE to join words split
+# across line ends - less cleanup left for normalize_text
+PDF_TEXT_FLAGS = (fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_WHITESPACE) | fitz.TEXT_DEHYPHENATE
+
+# Language detection: shorter texts are reported as "und", longer ones are sampled
+# (language is a document-wide property, langdetect cost grows with input length)
+LANG_DETECT_MIN_CHARS = 40
+LANG_DETECT_SAMPLE_CHARS = 8192
+_LANG_RE = re.compile(r'^[a-z]{2}$')
+
+# Make langdetect deterministic across runs
+DetectorFactory.seed = 0
+
+
+def _replace_whitespace(match) -> str:
+    """Collapse a whitespace run: spaces/tabs -> ' ', one newline -> '\n', more -> '\n\n'"""
+    newlines = match.group().count('\n')
+    if newlines == 0:
+        return ' '
+    return '\n' if newlines == 1 else '\n\n'
+
+
+# Non-UTF-8 TXT inputs larger than this have their encoding detected from the first
+# TXT_SNIFF_BYTES only
+TXT_SNIFF_THRESHOLD = 1_000_000
+TXT_SNIFF_BYTES = 64 * 1024
+
+# Unicode ranges that Western single-byte code pages decode into; detection results
+# limited to these are not trusted (cp1250/cp1252/cp1257... are indistinguishable),
+# such text is decoded as cp1252 (or latin-1 for bytes cp1252 leaves undefined)
+_LATIN_ALPHABETS = ('Basic Latin', 'Latin', 'General Punctuation')
+
+
+def _detect_text_encoding(data: bytes) -> Optional[str]:
+    """Encoding detected by charset_normalizer, or None if detection isn't trustworthy"""
+    sample = data[:TXT_SNIFF_BYTES] if len(data) > TXT_SNIFF_THRESHOLD else data
+    best = from_bytes(sample).best()
+    if best is None or best.coherence <= 0:
+        return None
+    if all(alphabet.startswith(_LATIN_ALPHABETS) for alphabet in best.alphabets):
+        return None
+    return best.encoding
+
+
+def _decode_text_bytes(data: bytes) -> str:
+    """Decode TXT content: UTF-8, else a confidently detected encoding, else cp1252/latin-1"""
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+    
+    encoding = _detect_text_encoding(data)
+    if encoding is not None:
+        try:
+            return data.decode(encoding)
+        except (UnicodeDecodeError, LookupError):
+            pass  # Sample wasn't representative of the whole file
+    try:
+        return data.decode('cp1252')
+    except UnicodeDecodeError:
+        return data.decode('latin-1')
+
+
+def _overlap_tail(chunk: str, overlap: int) -> str:
+    """Last `overlap` chars of a chunk, starting at a word boundary"""
+    if overlap <= 0:
+        return ""
+    if len(chunk) <= overlap:
+        return chunk
+    tail = chunk[-overlap:]
+    # Drop the partial word at the start of the tail
+    for idx, char in enumerate(tail):
+        if char.isspace():
+            return tail[idx + 1:].lstrip()
+    return ""
+
+
+def _split_long_paragraph(paragraph: str, size: int, overlap: int) -> List[str]:
+    """Split a paragraph longer than `size` into overlapping windows cut at whitespace"""
+    pieces = []
+    start = 0
+    length = len(paragraph)
+    
+    while length - start > size:
+        end = start + size
+        # Cut at the last line break or space in the second half of the window
+        cut = max(
+            paragraph.rfind("\n", start + size // 2, end),
+            paragraph.rfind(" ", start + size // 2, end)
+        )
+        if cut <= start:
+            cut = end
+        pieces.append(paragraph[start:cut])
+        
+        # Next window starts `overlap` chars back, snapped to the following word
+        next_start = paragraph.find(" ", max(cut - overlap, start + 1), cut)
+        start = next_start + 1 if next_start != -1 else cut
+    
+    pieces.append(paragraph[start:])
+    return pieces
+
+
+def _fast_chunk(text: str, size: int, overlap: int) -> List[str]:
+    """
+    Split text into chunks of at most `size` chars in one pass
+    
+    Paragraphs (separated by blank lines) are packed greedily into chunks; each new
+    chunk starts with the last `overlap` chars of the previous one when they fit.
+    Paragraphs longer than `size` are split into overlapping windows, each of which
+    starts a new chunk (the window carries the overlap itself).
+    
+    Args:
+        text: Normalized text
+        size: Maximum chunk size in characters
+        overlap: Overlap between consecutive chunks in characters
+        
+    Returns:
+        List of chunk strings
+    
+    Raises:
+        ValueError: If overlap is not smaller than size
+    """
+    if overlap >= size:
+        raise ValueError(
+            f"Chunk overlap ({overlap}) must be smaller than chunk size ({size})"
+        )
+    
+    chunks = []
+    current: List[str] = []
+    current_len = 0
+    
+    for paragraph in text.split("\n\n"):
+        pieces = (
+            _split_long_paragraph(paragraph, size, overlap)
+            if len(paragraph) > size else [paragraph]
+        )
+        for index, piece in enumerate(pieces):
+            piece_len = len(piece)
+            if index:
+                # Later windows of a long paragraph already start with their overlap
+                chunks.append("\n\n".join(current))
+                current, current_len = [piece], piece_len
+                continue
+            
+            if current and current_len + 2 + piece_len > size:
+                chunk = "\n\n".join(current)
+                chunks.append(chunk)
+                
+                tail = _overlap_tail(chunk, overlap)
+                if tail and len(tail) + 2 + piece_len <= size:
+                    current, current_len = [tail], len(tail)
+                else:
+                    current, current_len = [], 0
+            
+            current.append(piece)
+            current_len = current_len + 2 + piece_len if current_len else piece_len
+    
+    if current:
+        chunks.append("\n\n".join(current))
+    
+    return chunks
 
 
 class OCRService:
@@ -21,7 +189,8 @@ class OCRService:
     def __init__(
         self,
         chunk_size: int = 512,
-        chunk_overlap: int = 50
+        chunk_overlap: int = 50,
+        use_langchain_splitter: bool = False
     ):
         """
         Initialize OCR service
@@ -29,24 +198,37 @@ class OCRService:
         Args:
             chunk_size: Chunk size in characters (default: 512)
             chunk_overlap: Chunk overlap in characters (default: 50)
+            use_langchain_splitter: Chunk with LangChain's RecursiveCharacterTextSplitter
+                instead of the built-in paragraph packer (default: False)
+        
+        Raises:
+            ValueError: If chunk_overlap is not smaller than chunk_size
         """
+        if chunk_overlap >= chunk_size:
+            raise ValueError(
+                f"Chunk overlap ({chunk_overlap}) must be smaller than chunk size ({chunk_size})"
+            )
+        
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.text_splitter = None
         
-        # Initialize LangChain text splitter
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
-            separators=[
-                "\n\n",  # Paragraph breaks
-                "\n",    # Line breaks
-                ". ",    # Sentence endings
-                "? ",
-                "! ",
-                " ",     # Spaces
-            ]
-        )
+        if use_langchain_splitter:
+            from langchain_text_splitters import RecursiveCharacterTextSplitter
+            
+            self.text_splitter = RecursiveCharacterTextSplitter(
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                length_function=len,
+                separators=[
+                    "\n\n",  # Paragraph breaks
+                    "\n",    # Line breaks
+                    ". ",    # Sentence endings
+                    "? ",
+                    "! ",
+                    " ",     # Spaces
+                ]
+            )
     
     def normalize_text(self, text: str) -> str:
         """
@@ -64,105 +246,140 @@ class OCRService:
         # Normalize Unicode to NFC
         text = unicodedata.normalize('NFC', text)
         
-        # Preserve paragraph breaks (double newlines)
-        # Replace multiple spaces with single space (but preserve \n\n)
-        text = regex.sub(r'[ \t]+', ' ', text)  # Collapse spaces/tabs
-        text = regex.sub(r'\n[ \t]+', '\n', text)  # Remove spaces after newlines
-        text = regex.sub(r'[ \t]+\n', '\n', text)  # Remove spaces before newlines
-        
-        # Collapse multiple newlines (but preserve at least one)
-        text = regex.sub(r'\n{3,}', '\n\n', text)
+        # Collapse spaces/tabs, drop spaces around newlines and cap newline runs at
+        # one paragraph break (\n\n) - all in one pass
+        text = _RE_WS.sub(_replace_whitespace, text)
         
         # Trim whitespace
         text = text.strip()
         
         return text
     
-    def extract_pdf_text(self, file_bytes: bytes, file_name: str) -> Tuple[str, int, int]:
+    def _open_pdf(self, file_bytes: Optional[bytes], file_path: Optional[str] = None) -> fitz.Document:
+        """Open a PDF from a local path if given (pages are read lazily), else from bytes"""
+        if file_path:
+            return fitz.open(file_path, filetype="pdf")
+        return fitz.open(stream=file_bytes, filetype="pdf")
+    
+    def _extract_page_text(self, page: fitz.Page) -> str:
+        """Extract and normalize the text of a single PDF page"""
+        # Try blocks first (better reading order)
+        try:
+            blocks = page.get_text("blocks", flags=PDF_TEXT_FLAGS)
+            # Blocks are (x0, y0, x1, y1, text, block_no, block_type) on PyMuPDF >= 1.24;
+            # image blocks are not emitted since PDF_TEXT_FLAGS omits TEXT_PRESERVE_IMAGES
+            page_text = "\n".join([block[4] for block in blocks if block[4]])
+            
+            if not page_text.strip():
+                # Fallback to regular text extraction
+                page_text = page.get_text("text", flags=PDF_TEXT_FLAGS)
+        except Exception:
+            # Fallback to regular text extraction
+            page_text = page.get_text("text", flags=PDF_TEXT_FLAGS)
+        
+        return self.normalize_text(page_text)
+    
+    def extract_pdf_text(
+        self,
+        file_bytes: Optional[bytes],
+        file_name: str,
+        file_path: Optional[str] = None
+    ) -> Tuple[List[str], int, int]:
         """
-        Extract text from PDF using PyMuPDF
+        Extract per-page text from PDF using PyMuPDF
+        
+        Pages are extracted sequentially: PyMuPDF is not thread-safe and holds the GIL,
+        so a thread pool adds risk without any speedup.
         
         Args:
-            file_bytes: PDF file content as bytes
+            file_bytes: PDF file content as bytes (ignored if file_path is given)
             file_name: File name for logging
+            file_path: Optional local path to read the PDF from instead of file_bytes
             
         Returns:
-            Tuple of (text, total_pages, pages_without_text)
+            Tuple of (normalized text per page ("" for pages without text),
+            total_pages, pages_without_text)
         """
         try:
-            doc = fitz.open(stream=file_bytes, filetype="pdf")
+            doc = self._open_pdf(file_bytes, file_path)
             total_pages = len(doc)
-            pages_without_text = 0
-            text_parts = []
             
             logger.info(f"Processing PDF: {file_name} ({total_pages} pages)")
             
-            for page_num in range(total_pages):
-                page = doc[page_num]
-                
-                # Try blocks first (better reading order)
-                try:
-                    blocks = page.get_text("blocks")
-                    page_text = ""
-                    for block in blocks:
-                        if len(block) >= 4:  # Block has text content
-                            block_text = block[4]
-                            if block_text:
-                                page_text += block_text + "\n"
-                    
-                    if not page_text.strip():
-                        # Fallback to regular text extraction
-                        page_text = page.get_text("text")
-                except Exception:
-                    # Fallback to regular text extraction
-                    page_text = page.get_text("text")
-                
-                page_text = self.normalize_text(page_text)
-                
-                if not page_text.strip():
+            try:
+                page_texts = [self._extract_page_text(page) for page in doc]
+            finally:
+                doc.close()
+            
+            pages_without_text = 0
+            for page_num, page_text in enumerate(page_texts):
+                if not page_text:
                     pages_without_text += 1
                     logger.warning(
                         f"Page {page_num + 1} in {file_name} has no extractable text "
                         "(image-only page)"
                     )
-                else:
-                    text_parts.append(page_text)
-            
-            doc.close()
-            
-            full_text = "\n\n".join(text_parts)
             
             logger.info(
                 f"Extracted text from PDF: {file_name} "
                 f"({total_pages} pages, {pages_without_text} without text)"
             )
             
-            return full_text, total_pages, pages_without_text
+            return page_texts, total_pages, pages_without_text
         
         except Exception as e:
             logger.error(f"Error extracting text from PDF {file_name}: {e}")
             raise
     
-    def extract_docx_text(self, file_bytes: bytes, file_name: str) -> Tuple[str, int, int]:
+    def extract_pdf_text_joined(
+        self,
+        file_bytes: Optional[bytes],
+        file_name: str,
+        file_path: Optional[str] = None
+    ) -> Tuple[str, int, int]:
+        """
+        Extract text from PDF as a single string (pages separated by blank lines)
+        
+        Args:
+            file_bytes: PDF file content as bytes (ignored if file_path is given)
+            file_name: File name for logging
+            file_path: Optional local path to read the PDF from instead of file_bytes
+            
+        Returns:
+            Tuple of (text, total_pages, pages_without_text)
+        """
+        page_texts, total_pages, pages_without_text = self.extract_pdf_text(
+            file_bytes, file_name, file_path
+        )
+        return "\n\n".join(text for text in page_texts if text), total_pages, pages_without_text
+    
+    def extract_docx_text(
+        self,
+        file_bytes: Optional[bytes],
+        file_name: str,
+        file_path: Optional[str] = None
+    ) -> Tuple[str, int, int]:
         """
         Extract text from DOC/DOCX using python-docx
         
         Args:
-            file_bytes: DOCX file content as bytes
+            file_bytes: DOCX file content as bytes (ignored if file_path is given)
             file_name: File name for logging
+            file_path: Optional local path to read the document from instead of file_bytes
             
         Returns:
             Tuple of (text, total_pages (always 1), pages_without_text (always 0))
         """
         try:
-            doc = Document(io.BytesIO(file_bytes))
-            paragraphs = []
-            
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    paragraphs.append(para.text)
+            doc = Document(file_path or io.BytesIO(file_bytes))
             
-            text = "\n\n".join(paragraphs)
+            # Paragraph.text is rebuilt from its runs on every access, so read it once;
+            # isspace() tests for blank paragraphs without allocating a stripped copy
+            text = "\n\n".join(
+                para_text
+                for para in doc.paragraphs
+                if (para_text := para.text) and not para_text.isspace()
+            )
             text = self.normalize_text(text)
             
             logger.info(f"Extracted text from DOCX: {file_name}")
@@ -174,26 +391,29 @@ class OCRService:
             logger.error(f"Error extracting text from DOCX {file_name}: {e}")
             raise
     
-    def extract_txt_text(self, file_bytes: bytes, file_name: str) -> Tuple[str, int, int]:
+    def extract_txt_text(
+        self,
+        file_bytes: Optional[bytes],
+        file_name: str,
+        file_path: Optional[str] = None
+    ) -> Tuple[str, int, int]:
         """
         Extract text from TXT file
         
         Args:
-            file_bytes: TXT file content as bytes
+            file_bytes: TXT file content as bytes (ignored if file_path is given)
             file_name: File name for logging
+            file_path: Optional local path to read the file from instead of file_bytes
             
         Returns:
             Tuple of (text, total_pages (always 1), pages_without_text (always 0))
         """
         try:
-            # Try UTF-8 first
-            try:
-                text = file_bytes.decode('utf-8')
-            except UnicodeDecodeError:
-                # Fallback to latin-1
-                text = file_bytes.decode('latin-1')
+            if file_path:
+                with open(file_path, 'rb') as f:
+                    file_bytes = f.read()
             
-            text = self.normalize_text(text)
+            text = self.normalize_text(_decode_text_bytes(file_bytes))
             
             logger.info(f"Extracted text from TXT: {file_name}")
             
@@ -206,35 +426,62 @@ class OCRService:
     
     def extract_text(
         self,
-        file_bytes: bytes,
+        file_bytes: Optional[bytes],
         file_name: str,
-        mime_type: Optional[str] = None
+        mime_type: Optional[str] = None,
+        file_path: Optional[str] = None
     ) -> Tuple[str, int, int]:
         """
         Extract text from file based on extension/MIME type
         
         Args:
-            file_bytes: File content as bytes
+            file_bytes: File content as bytes (ignored if file_path is given)
             file_name: File name
             mime_type: Optional MIME type
+            file_path: Optional local path to read the file from instead of file_bytes
             
         Returns:
             Tuple of (text, total_pages, pages_without_text)
         """
         ext = os.path.splitext(file_name)[1].lower()
         
-        if ext == '.pdf' or mime_type == 'application/pdf':
-            return self.extract_pdf_text(file_bytes, file_name)
+        if self._is_pdf(file_name, mime_type):
+            return self.extract_pdf_text_joined(file_bytes, file_name, file_path)
         elif ext in ['.doc', '.docx'] or mime_type in [
             'application/msword',
             'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
         ]:
-            return self.extract_docx_text(file_bytes, file_name)
+            return self.extract_docx_text(file_bytes, file_name, file_path)
         elif ext == '.txt' or mime_type == 'text/plain':
-            return self.extract_txt_text(file_bytes, file_name)
+            return self.extract_txt_text(file_bytes, file_name, file_path)
         else:
             raise ValueError(f"Unsupported file type: {file_name} (ext: {ext}, mime: {mime_type})")
     
+    def _is_pdf(self, file_name: str, mime_type: Optional[str]) -> bool:
+        """Whether the file should be handled by the PDF extractor"""
+        return os.path.splitext(file_name)[1].lower() == '.pdf' or mime_type == 'application/pdf'
+    
+    def _extract_pages(
+        self,
+        file_bytes: Optional[bytes],
+        file_name: str,
+        mime_type: Optional[str] = None,
+        file_path: Optional[str] = None
+    ) -> Tuple[List[str], int, int]:
+        """
+        Extract text per page: one entry per PDF page, a single entry for DOC/DOCX/TXT
+        
+        Returns:
+            Tuple of (page texts, total_pages, pages_without_text)
+        """
+        if self._is_pdf(file_name, mime_type):
+            return self.extract_pdf_text(file_bytes, file_name, file_path)
+        
+        text, total_pages, pages_without_text = self.extract_text(
+            file_bytes, file_name, mime_type, file_path
+        )
+        return [text], total_pages, pages_without_text
+    
     def detect_language(self, text: str) -> str:
         """
         Detect language of text using langdetect
@@ -245,15 +492,30 @@ class OCRService:
         Returns:
             Language code (2-letter ISO code) or "und" if undetected
         """
-        if not text or not text.strip():
+        if not text:
+            return "und"
+        
+        text = text.strip()
+        if len(text) < LANG_DETECT_MIN_CHARS:
             return "und"
         
+        if len(text) > LANG_DETECT_SAMPLE_CHARS:
+            # Sample the start, middle and end so a cover page or appendix in
+            # another language doesn't decide the result on its own
+            part = LANG_DETECT_SAMPLE_CHARS // 4
+            middle = len(text) // 2 - part // 2
+            text = "\n".join((
+                text[:part * 2],
+                text[middle:middle + part],
+                text[-part:]
+            ))
+        
         try:
             # Try simple detection
             lang = detect(text)
             
             # Validate format (should be 2-letter code)
-            if re.match(r'^[a-z]{2}$', lang):
+            if _LANG_RE.match(lang):
                 return lang
             else:
                 logger.warning(f"Detected language '{lang}' doesn't match expected format")
@@ -267,7 +529,7 @@ class OCRService:
                     top_lang = langs[0]
                     if top_lang.prob >= 0.75:
                         lang_code = top_lang.lang
-                        if re.match(r'^[a-z]{2}$', lang_code):
+                        if _LANG_RE.match(lang_code):
                             return lang_code
                 
                 logger.warning(f"Could not detect language with confidence >= 0.75")
@@ -284,7 +546,9 @@ class OCRService:
         total_pages: int
     ) -> List[Dict[str, Any]]:
         """
-        Chunk text using LangChain RecursiveCharacterTextSplitter
+        Chunk text by packing paragraphs (or with LangChain's
+        RecursiveCharacterTextSplitter when the service was created with
+        use_langchain_splitter=True)
         
         Args:
             text: Text to chunk
@@ -298,7 +562,10 @@ class OCRService:
             return []
         
         # Split text into chunks
-        chunks = self.text_splitter.split_text(text)
+        if self.text_splitter is not None:
+            chunks = self.text_splitter.split_text(text)
+        else:
+            chunks = _fast_chunk(text, self.chunk_size, self.chunk_overlap)
         
         # Filter out empty chunks
         valid_chunks = []
@@ -320,24 +587,30 @@ class OCRService:
         
         return valid_chunks
     
-    def process_document(
+    def process_document_streaming(
         self,
-        file_bytes: bytes,
+        file_bytes: Optional[bytes],
         file_name: str,
         doc_id: Optional[str] = None,
-        mime_type: Optional[str] = None
-    ) -> Dict[str, Any]:
+        mime_type: Optional[str] = None,
+        file_path: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
         """
-        Process a document: extract text, detect language, chunk
+        Process a document like process_document, but produce chunks lazily
+        
+        Text extraction and language detection happen up front; each page is chunked
+        only when the iterator reaches it, so callers can persist chunks without
+        holding every chunk of the document at once.
         
         Args:
-            file_bytes: File content as bytes
+            file_bytes: File content as bytes (ignored if file_path is given)
             file_name: File name
             doc_id: Optional document ID (will be generated if not provided)
             mime_type: Optional MIME type
+            file_path: Optional local path to read the file from instead of file_bytes
             
         Returns:
-            Dictionary with processed document data
+            Tuple of (document data without 'chunks'/'chunks_emitted', chunk iterator)
         """
         # Generate doc_id if not provided
         if not doc_id:
@@ -347,23 +620,23 @@ class OCRService:
             date_str = datetime.now().strftime('%Y-%m-%d')
             doc_id = f"doc:{slug}@{date_str}"
         
-        # Extract text
-        text, total_pages, pages_without_text = self.extract_text(
-            file_bytes, file_name, mime_type
+        # Extract text (once; pages are chunked from this result)
+        page_texts, total_pages, pages_without_text = self._extract_pages(
+            file_bytes, file_name, mime_type, file_path
         )
+        text = "\n\n".join(page_text for page_text in page_texts if page_text)
         
         if not text or not text.strip():
             logger.warning(f"Document {file_name} has no extractable text")
             return {
                 'doc_id': doc_id,
                 'file_name': file_name,
+                'text': '',
                 'language': 'und',
                 'total_page_count': total_pages,
                 'pages_without_text': pages_without_text,
-                'chunks': [],
-                'chunks_emitted': 0,
                 'lang_undetected': False
-            }
+            }, iter(())
         
         # Detect language
         language = self.detect_language(text)
@@ -372,73 +645,76 @@ class OCRService:
         if lang_undetected:
             logger.warning(f"Could not detect language for {file_name}")
         
-        # Chunk text
-        # For PDFs: chunk per page; for DOC/DOCX/TXT: single page
-        all_chunks = []
-        
-        if total_pages == 1:
-            # Single page document (DOC/DOCX/TXT or single-page PDF)
-            page_chunks = self.chunk_text(text, 0, 1)
-            for chunk in page_chunks:
-                all_chunks.append({
+        document = {
+            'doc_id': doc_id,
+            'file_name': file_name,
+            'text': text,
+            'language': language,
+            'total_page_count': total_pages,
+            'pages_without_text': pages_without_text,
+            'lang_undetected': lang_undetected
+        }
+        return document, self._iter_chunks(page_texts, doc_id, file_name, language, total_pages)
+    
+    def _iter_chunks(
+        self,
+        page_texts: List[str],
+        doc_id: str,
+        file_name: str,
+        language: str,
+        total_pages: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield chunk records page by page (PDFs: per page; DOC/DOCX/TXT: single page)"""
+        for page_num, page_text in enumerate(page_texts):
+            if not page_text:
+                continue
+            
+            for chunk in self.chunk_text(page_text, page_num, total_pages):
+                yield {
                     'doc_id': doc_id,
                     'file_name': file_name,
                     'language': language,
                     'total_page_count': total_pages,
-                    'page_index': 0,
+                    'page_index': page_num,
                     'chunk_index': chunk['chunk_index'],
                     'text': chunk['text']
-                })
-        else:
-            # Multi-page PDF: chunk per page
-            doc = fitz.open(stream=file_bytes, filetype="pdf")
-            for page_num in range(total_pages):
-                page = doc[page_num]
-                
-                # Extract page text
-                try:
-                    blocks = page.get_text("blocks")
-                    page_text = ""
-                    for block in blocks:
-                        if len(block) >= 4:
-                            block_text = block[4]
-                            if block_text:
-                                page_text += block_text + "\n"
-                    if not page_text.strip():
-                        page_text = page.get_text("text")
-                except Exception:
-                    page_text = page.get_text("text")
-                
-                page_text = self.normalize_text(page_text)
-                
-                if page_text.strip():
-                    page_chunks = self.chunk_text(page_text, page_num, total_pages)
-                    for chunk in page_chunks:
-                        all_chunks.append({
-                            'doc_id': doc_id,
-                            'file_name': file_name,
-                            'language': language,
-                            'total_page_count': total_pages,
-                            'page_index': page_num,
-                            'chunk_index': chunk['chunk_index'],
-                            'text': chunk['text']
-                        })
-            
-            doc.close()
+                }
+    
+    def process_document(
+        self,
+        file_bytes: Optional[bytes],
+        file_name: str,
+        doc_id: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        file_path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Process a document: extract text, detect language, chunk
         
-        logger.info(
-            f"Processed document {file_name}: {len(all_chunks)} chunks, "
-            f"language={language}, pages={total_pages}"
+        Args:
+            file_bytes: File content as bytes (ignored if file_path is given)
+            file_name: File name
+            doc_id: Optional document ID (will be generated if not provided)
+            mime_type: Optional MIME type
+            file_path: Optional local path to read the file from instead of file_bytes
+            
+        Returns:
+            Dictionary with processed document data, including the full normalized
+            text ('text') so callers don't need to extract it again
+        """
+        document, chunk_iter = self.process_document_streaming(
+            file_bytes, file_name, doc_id, mime_type, file_path
         )
+        all_chunks = list(chunk_iter)
+        
+        if document['text']:
+            logger.info(
+                f"Processed document {file_name}: {len(all_chunks)} chunks, "
+                f"language={document['language']}, pages={document['total_page_count']}"
+            )
         
         return {
-            'doc_id': doc_id,
-            'file_name': file_name,
-            'language': language,
-            'total_page_count': total_pages,
-            'pages_without_text': pages_without_text,
+            **document,
             'chunks': all_chunks,
-            'chunks_emitted': len(all_chunks),
-            'lang_undetected': lang_undetected
+            'chunks_emitted': len(all_chunks)
         }
-
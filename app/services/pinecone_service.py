@@ -3,23 +3,48 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
+import numpy as np
+import openai
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
 from loguru import logger
-from pinecone import Pinecone, PineconeException
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+from pinecone import Pinecone, PineconeAsyncio, PineconeException
 from langchain_openai import OpenAIEmbeddings
 
 from app.config import settings
+from app.services.http import get_async_http_client
+
+
+# Query embeddings requested within this window are sent as one OpenAI request
+EMBED_BATCH_SIZE = 64
+EMBED_BATCH_WINDOW_MS = 5
+
+# Retrieval cache: exact (query, top_k, namespace, filter) hits skip embedding and
+# search; queries whose embedding is this similar to a cached one reuse its result
+QUERY_CACHE_MAXSIZE = 4096
+QUERY_CACHE_TTL_SECONDS = 300
+SEMANTIC_CACHE_SIZE = 256
+SEMANTIC_CACHE_THRESHOLD = 0.97
+
+# Settings are fixed for the life of the process; bind the per-query ones once
+_TOP_K_DEFAULT = settings.RAG_TOP_K
+_EMBED_DIM = settings.EMBEDDING_DIMENSION
 
 
 class PineconeServiceError(RuntimeError):
     """Custom error for Pinecone service issues."""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetrievedChunk:
     """Structured representation of a Pinecone match."""
 
@@ -27,6 +52,56 @@ class RetrievedChunk:
     score: float
     text: str
     metadata: Dict[str, Any]
+    stripped: str = field(init=False, repr=False, compare=False)
+    _snippets: Dict[int, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Chunk text without surrounding whitespace, shared by every context builder
+        object.__setattr__(self, "stripped", (self.text or "").strip())
+
+    def snippet(self, max_chars: int) -> str:
+        """Stripped text cut to ``max_chars`` with a trailing ellipsis (cached per length)."""
+
+        snippet = self._snippets.get(max_chars)
+        if snippet is None:
+            text = self.stripped
+            snippet = text[:max_chars] + "…" if len(text) > max_chars else text
+            self._snippets[max_chars] = snippet
+        return snippet
+
+
+@dataclass(slots=True, frozen=True)
+class Citation:
+    """Citation record for a chunk included in a QnA context block."""
+
+    label: int
+    id: Optional[str]
+    score: float
+    source_file: Optional[str]
+    source_url: Optional[str]
+    page_index: Any
+    chunk_index: Any
+    title: Optional[str]
+    court_name: Optional[str]
+    case_number: Optional[str]
+    decision_date: Optional[str]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Serialize for API responses and logs (same keys as the field names)."""
+
+        return {
+            "label": self.label,
+            "id": self.id,
+            "score": self.score,
+            "source_file": self.source_file,
+            "source_url": self.source_url,
+            "page_index": self.page_index,
+            "chunk_index": self.chunk_index,
+            "title": self.title,
+            "court_name": self.court_name,
+            "case_number": self.case_number,
+            "decision_date": self.decision_date,
+        }
 
 
 def _require_env(value: Optional[str], name: str) -> str:
@@ -45,6 +120,7 @@ def get_embeddings() -> OpenAIEmbeddings:
         api_key=api_key,
         model="text-embedding-3-small",
         max_retries=settings.LLM_MAX_RETRIES,
+        http_async_client=get_async_http_client(),
     )
 
 
@@ -73,20 +149,276 @@ def get_pinecone_index():
         raise PineconeServiceError("Unable to initialize Pinecone index. Check configuration and connectivity.") from exc
 
 
+@lru_cache(maxsize=1)
+def _pinecone_index_host() -> str:
+    """Resolve (once) the data-plane host of the configured Pinecone index."""
+    index_name = _require_env(settings.PINECONE_INDEX_NAME, "PINECONE_INDEX_NAME")
+    try:
+        return get_pinecone_client().describe_index(index_name).host
+    except PineconeException as exc:
+        logger.error(f"Failed to describe Pinecone index '{index_name}': {exc}")
+        raise PineconeServiceError("Unable to initialize Pinecone index. Check configuration and connectivity.") from exc
+
+
+_async_index = None
+
+
+async def get_async_pinecone_index():
+    """Get the shared asyncio Pinecone index (one aiohttp session per process)."""
+    global _async_index
+    if _async_index is None:
+        host = await asyncio.to_thread(_pinecone_index_host)
+        if _async_index is None:
+            api_key = _require_env(settings.PINECONE_API_KEY, "PINECONE_API_KEY")
+            logger.debug("Connecting to Pinecone index (asyncio)", host=host)
+            _async_index = PineconeAsyncio(api_key=api_key).IndexAsyncio(host=host)
+    return _async_index
+
+
+async def close_async_pinecone_index() -> None:
+    """Close the shared asyncio Pinecone index, if one was opened."""
+    global _async_index
+    if _async_index is not None:
+        index, _async_index = _async_index, None
+        await index.close()
+
+
+@lru_cache(maxsize=1)
 def _zero_embedding_vector() -> List[float]:
-    """Return a reusable zero vector matching the embedding dimension."""
+    """Return a reusable zero vector matching the embedding dimension.
+
+    The same list is returned on every call; callers must not mutate it.
+    """
+
+    return [0.0] * _EMBED_DIM
 
-    return [0.0] * settings.EMBEDDING_DIMENSION
+
+# Rate limiting and backoff for OpenAI embedding and Pinecone query requests
+RATE_LIMIT_MAX_ATTEMPTS = 6
+RATE_LIMIT_MAX_WAIT_SECONDS = 30
+
+
+@lru_cache(maxsize=1)
+def _embed_limiter() -> AsyncLimiter:
+    return AsyncLimiter(settings.OPENAI_MAX_REQUESTS_PER_MINUTE, 60)
+
+
+@lru_cache(maxsize=1)
+def _pinecone_limiter() -> AsyncLimiter:
+    return AsyncLimiter(settings.PINECONE_MAX_QUERIES_PER_SECOND, 1)
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    """OpenAI RateLimitError or a Pinecone API error with HTTP status 429."""
+
+    return isinstance(exc, openai.RateLimitError) or getattr(exc, "status", None) == 429
+
+
+def _retry_after_seconds(exc: Optional[BaseException]) -> Optional[float]:
+    """Seconds requested by the server's Retry-After header, if present."""
+
+    headers = getattr(getattr(exc, "response", None), "headers", None) or getattr(exc, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+_backoff = wait_exponential_jitter(initial=1, max=RATE_LIMIT_MAX_WAIT_SECONDS)
+
+
+def _wait_for_rate_limit(retry_state) -> float:
+    """Honor Retry-After when the server sends it, else exponential backoff with jitter."""
+
+    retry_after = _retry_after_seconds(retry_state.outcome.exception())
+    if retry_after is not None:
+        return min(retry_after, RATE_LIMIT_MAX_WAIT_SECONDS)
+    return _backoff(retry_state)
+
+
+_retry_rate_limited = retry(
+    retry=retry_if_exception(_is_rate_limited),
+    wait=_wait_for_rate_limit,
+    stop=stop_after_attempt(RATE_LIMIT_MAX_ATTEMPTS),
+    reraise=True,
+)
+
+
+@_retry_rate_limited
+async def _aembed_documents(texts: List[str]) -> List[List[float]]:
+    async with _embed_limiter():
+        return await get_embeddings().aembed_documents(texts)
+
+
+@_retry_rate_limited
+async def _query_index(**query: Any) -> Any:
+    index = await get_async_pinecone_index()
+    async with _pinecone_limiter():
+        return await index.query(**query)
+
+
+class _EmbedBatcher:
+    """Coalesce concurrent query embeddings into a single embed_documents request.
+
+    Texts submitted while a batch is open (up to ``max_batch`` texts or ``window_ms``
+    after the first one) share one OpenAI round-trip; duplicate texts are embedded once
+    and every caller submitting them gets the same vector.
+    """
+
+    def __init__(self, max_batch: int = EMBED_BATCH_SIZE, window_ms: float = EMBED_BATCH_WINDOW_MS):
+        self._max_batch = max_batch
+        self._window = window_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._dispatches: set[asyncio.Task] = set()
+
+    async def submit(self, text: str) -> List[float]:
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._collect())
+        future: asyncio.Future = loop.create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._window
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch in the background so the next batch can start collecting
+            task = loop.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        # Identical texts are embedded once and share the resulting vector
+        pending: Dict[str, List[asyncio.Future]] = {}
+        for text, future in batch:
+            pending.setdefault(text, []).append(future)
+        try:
+            vectors = await _aembed_documents(list(pending))
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        logger.debug("Embedded query batch", size=len(batch), unique=len(pending))
+        for futures, vector in zip(pending.values(), vectors):
+            for future in futures:
+                if not future.done():
+                    future.set_result(vector)
+
+
+_embed_batcher = _EmbedBatcher()
 
 
 async def _embed_query_text(query_text: str) -> List[float]:
     logger.debug("Generating embedding for query", preview=query_text[:120])
-    embeddings = get_embeddings()
-    embedding = await asyncio.to_thread(embeddings.embed_query, query_text)
+    embedding = await _embed_batcher.submit(query_text)
     logger.debug("Embedding generated", dimensions=len(embedding))
     return embedding
 
 
+def _json_default(value: Any) -> Any:
+    return dict(value) if isinstance(value, Mapping) else str(value)
+
+
+def _cache_key(*parts: Any) -> str:
+    """Stable digest of JSON-serializable cache key parts."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=_json_default)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+_NO_FILTER: Mapping[str, Any] = MappingProxyType({})
+
+
+@lru_cache(maxsize=128)
+def _dataset_filter(dataset_name: str) -> Mapping[str, Any]:
+    """Shared, read-only Pinecone filter selecting one dataset."""
+    return MappingProxyType({"dataset_name": MappingProxyType({"$eq": dataset_name})})
+
+
+def _filter_dict(filter_payload: Mapping[str, Any]) -> Dict[str, Any]:
+    """Plain-dict copy of a (possibly read-only) filter for the Pinecone client."""
+    return {
+        key: _filter_dict(value) if isinstance(value, Mapping) else value
+        for key, value in filter_payload.items()
+    }
+
+
+class _SemanticQueryCache:
+    """Recent query embeddings, matched by cosine similarity within a retrieval scope.
+
+    Vectors live in one preallocated (capacity x dimension) matrix of unit rows so a
+    lookup is a single matrix-vector product; the least recently used slot is reused
+    when the cache is full.
+    """
+
+    def __init__(self, capacity: int, dimension: int, threshold: float):
+        self._threshold = threshold
+        self._vectors = np.zeros((capacity, dimension), dtype=np.float32)
+        self._scopes = np.full(capacity, None, dtype=object)
+        self._keys: List[Optional[str]] = [None] * capacity
+        self._lru: "OrderedDict[int, None]" = OrderedDict()
+        self._free = list(range(capacity - 1, -1, -1))
+
+    @staticmethod
+    def _unit(vector: List[float]) -> Optional[np.ndarray]:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(array))
+        return array / norm if norm else None
+
+    def lookup(self, scope: str, vector: List[float]) -> Optional[str]:
+        """Return the exact-cache key of the most similar cached query in scope."""
+        if not self._lru:
+            return None
+        unit = self._unit(vector)
+        if unit is None or unit.shape[0] != self._vectors.shape[1]:
+            return None
+        similarities = np.where(self._scopes == scope, self._vectors @ unit, -1.0)
+        slot = int(np.argmax(similarities))
+        if similarities[slot] < self._threshold:
+            return None
+        self._lru.move_to_end(slot)
+        return self._keys[slot]
+
+    def add(self, scope: str, key: str, vector: List[float]) -> None:
+        unit = self._unit(vector)
+        if unit is None or unit.shape[0] != self._vectors.shape[1]:
+            return
+        slot = self._free.pop() if self._free else self._lru.popitem(last=False)[0]
+        self._vectors[slot] = unit
+        self._scopes[slot] = scope
+        self._keys[slot] = key
+        self._lru[slot] = None
+
+
+_query_cache: TTLCache = TTLCache(maxsize=QUERY_CACHE_MAXSIZE, ttl=QUERY_CACHE_TTL_SECONDS)
+
+
+@lru_cache(maxsize=1)
+def _semantic_query_cache() -> _SemanticQueryCache:
+    return _SemanticQueryCache(
+        SEMANTIC_CACHE_SIZE,
+        _EMBED_DIM,
+        SEMANTIC_CACHE_THRESHOLD,
+    )
+
+
 def _score_from_match(match: Any) -> float:
     """Safely extract a numeric score from a Pinecone match object."""
 
@@ -99,6 +431,41 @@ def _score_from_match(match: Any) -> float:
         return 0.0
 
 
+def _response_matches(response: Any) -> List[Any]:
+    """Return the match list of a Pinecone query response (object or dict)."""
+
+    matches = getattr(response, "matches", None)
+    if matches is None and isinstance(response, dict):
+        matches = response.get("matches", [])
+    return matches or []
+
+
+def _normalize_matches(
+    matches: List[Any],
+) -> Tuple[List[Optional[str]], np.ndarray, List[Dict[str, Any]], List[str]]:
+    """Unpack Pinecone matches into parallel (ids, scores, metadatas, texts) in one pass."""
+
+    count = len(matches)
+    ids: List[Optional[str]] = [None] * count
+    metadatas: List[Dict[str, Any]] = [None] * count  # type: ignore[list-item]
+    texts: List[str] = [""] * count
+    scores = np.zeros(count, dtype=np.float64)
+
+    for i, match in enumerate(matches):
+        if isinstance(match, dict):
+            ids[i] = match.get("id")
+            metadata = match.get("metadata")
+        else:
+            ids[i] = getattr(match, "id", None)
+            metadata = getattr(match, "metadata", None)
+        metadata = metadata or {}
+        metadatas[i] = metadata
+        texts[i] = metadata.get("text") or metadata.get("chunk") or ""
+        scores[i] = _score_from_match(match)
+
+    return ids, scores, metadatas, texts
+
+
 async def query_context(
     query: str,
     top_k: int | None = None,
@@ -112,12 +479,23 @@ async def query_context(
         logger.warning("Empty query received for Pinecone retrieval")
         return []
 
-    effective_top_k = top_k or settings.RAG_TOP_K
-    filter_payload: Dict[str, Any] = {}
+    effective_top_k = top_k or _TOP_K_DEFAULT
+    filter_payload: Mapping[str, Any]
     if filter:
-        filter_payload.update(filter)
-    if dataset_name:
-        filter_payload.setdefault("dataset_name", {"$eq": dataset_name})
+        filter_payload = dict(filter)
+        if dataset_name:
+            filter_payload.setdefault("dataset_name", {"$eq": dataset_name})
+    elif dataset_name:
+        filter_payload = _dataset_filter(dataset_name)
+    else:
+        filter_payload = _NO_FILTER
+
+    scope_key = _cache_key(effective_top_k, namespace, filter_payload)
+    query_key = _cache_key(query, scope_key)
+    cached = _query_cache.get(query_key)
+    if cached is not None:
+        logger.info("Pinecone retrieval served from cache", returned=len(cached))
+        return list(cached)
 
     logger.info(
         "Querying Pinecone",
@@ -134,16 +512,23 @@ async def query_context(
         logger.error(f"Failed to generate embedding for query: {exc}")
         raise PineconeServiceError("Unable to generate embedding for query text.") from exc
 
+    semantic_cache = _semantic_query_cache()
+    similar_key = semantic_cache.lookup(scope_key, vector)
+    if similar_key is not None:
+        cached = _query_cache.get(similar_key)
+        if cached is not None:
+            _query_cache[query_key] = cached
+            logger.info("Pinecone retrieval served from semantic cache", returned=len(cached))
+            return list(cached)
+
     try:
-        index = get_pinecone_index()
-        response = await asyncio.to_thread(
-            index.query,
+        response = await _query_index(
             vector=vector,
             top_k=effective_top_k,
             namespace=namespace,
             include_metadata=True,
             include_values=False,
-            filter=filter_payload or None,
+            filter=_filter_dict(filter_payload) or None,
         )
     except PineconeServiceError:
         logger.error("Pinecone index initialization failed during query")
@@ -152,68 +537,85 @@ async def query_context(
         logger.error(f"Pinecone query failed: {exc}")
         raise PineconeServiceError("Pinecone query failed. See logs for details.") from exc
 
-    matches = getattr(response, "matches", None)
-    if matches is None and isinstance(response, dict):
-        matches = response.get("matches", [])
-    matches = matches or []
+    matches = _response_matches(response)
     logger.debug("Pinecone query returned matches", count=len(matches))
-    chunks: List[RetrievedChunk] = []
+    ids, scores, metadatas, texts = _normalize_matches(matches)
 
-    sorted_matches = sorted(matches, key=_score_from_match, reverse=True)
+    # Highest score first; stable so equal scores keep Pinecone's order
+    order = np.argsort(-scores, kind="stable").tolist()
+    score_values = scores.tolist()
 
-    if sorted_matches:
-        preview: List[Dict[str, Any]] = []
-        for match in sorted_matches[: min(3, len(sorted_matches))]:
-            metadata = getattr(match, "metadata", None)
-            if metadata is None and isinstance(match, dict):
-                metadata = match.get("metadata", {})
-            metadata = metadata or {}
+    # Single pass: build chunks, collect the top-3 preview and emit trace records
+    # (trace arguments are only evaluated when TRACE is enabled)
+    chunks: List[RetrievedChunk] = []
+    preview: List[Dict[str, Any]] = []
+    trace = logger.opt(lazy=True).trace
+    for rank, i in enumerate(order):
+        metadata = metadatas[i]
+        text = texts[i]
+        score = score_values[i]
+        if rank < 3:
             preview.append({
-                "id": getattr(match, "id", None)
-                if not isinstance(match, dict)
-                else match.get("id"),
-                "score": round(_score_from_match(match), 4),
+                "id": ids[i],
+                "score": round(score, 4),
                 "source_file": metadata.get("source_file"),
                 "page_index": metadata.get("page_index"),
                 "chunk_index": metadata.get("chunk_index"),
                 "text_preview": (metadata.get("text") or "")[:200],
             })
-        logger.info(
-            "Pinecone top matches preview:\n{}",
-            json.dumps(preview, ensure_ascii=False, indent=2),
-        )
-
-    for match in sorted_matches:
-        metadata = getattr(match, "metadata", None)
-        if metadata is None and isinstance(match, dict):
-            metadata = match.get("metadata", {})
-        metadata = metadata or {}
-        text = metadata.get("text") or metadata.get("chunk") or ""
-        score = getattr(match, "score", None)
-        if score is None and isinstance(match, dict):
-            score = match.get("score")
-        logger.trace(
+        trace(
             "Pinecone match processed",
-            text_preview=text[:120],
-            score=score,
-            metadata_keys=list(metadata.keys()),
+            text_preview=lambda: text[:120],
+            score=lambda: score,
+            metadata_keys=lambda: list(metadata.keys()),
         )
-        chunks.append(
-            RetrievedChunk(
-                id=getattr(match, "id", None)
-                if not isinstance(match, dict)
-                else match.get("id"),
-                score=float(score) if score is not None else 0.0,
-                text=text,
-                metadata=metadata,
-            )
+        chunks.append(RetrievedChunk(id=ids[i], score=score, text=text, metadata=metadata))
+
+    if preview:
+        logger.opt(lazy=True).info(
+            "Pinecone top matches preview:\n{}",
+            lambda: json.dumps(preview, ensure_ascii=False, indent=2),
         )
 
     logger.info("Pinecone retrieval completed", returned=len(chunks))
+    if chunks:
+        _query_cache[query_key] = tuple(chunks)
+        semantic_cache.add(scope_key, query_key, vector)
     return chunks
 
 
-def fetch_full_document_chunks(
+def document_sort_key(chunk: RetrievedChunk) -> Tuple[int, int]:
+    """Sort key putting chunks in document order; missing or invalid indexes sort last."""
+
+    def index(key: str) -> int:
+        try:
+            return int((chunk.metadata or {}).get(key))
+        except (TypeError, ValueError):
+            return 1_000_000
+
+    return index("page_index"), index("chunk_index")
+
+
+def _chunk_partition_filters(
+    filter_payload: Dict[str, Any],
+    partitions: int,
+    max_chunks: int,
+) -> List[Dict[str, Any]]:
+    """Split a document filter into disjoint chunk_index residue classes.
+
+    chunk_index restarts on every page, so partition sizes depend on the page layout
+    (a PDF with two chunks per page fills only two partitions); callers must not
+    assume an even split.
+    """
+    if partitions <= 1:
+        return [filter_payload]
+    return [
+        {**filter_payload, "chunk_index": {"$in": list(range(remainder, max_chunks, partitions))}}
+        for remainder in range(partitions)
+    ]
+
+
+async def fetch_full_document_chunks(
     *,
     document_id: Optional[str],
     source_file: Optional[str],
@@ -242,47 +644,41 @@ def fetch_full_document_chunks(
         filter=filter_payload,
     )
 
+    max_chunks = settings.SUMMARY_DOC_MAX_CHUNKS
+    partitions = max(1, min(settings.SUMMARY_DOC_FETCH_PARTITIONS, max_chunks))
+
     try:
-        index = get_pinecone_index()
-        response = index.query(
-            id=None,
-            vector=_zero_embedding_vector(),
-            filter=filter_payload,
-            include_metadata=True,
-            include_values=False,
-            top_k=settings.SUMMARY_DOC_MAX_CHUNKS,
-        )
+        responses = await asyncio.gather(*(
+            _query_index(
+                vector=_zero_embedding_vector(),
+                filter=partition_filter,
+                include_metadata=True,
+                include_values=False,
+                top_k=max_chunks,
+            )
+            for partition_filter in _chunk_partition_filters(filter_payload, partitions, max_chunks)
+        ))
     except Exception as exc:  # pragma: no cover - safety net
         logger.error(f"Failed to fetch full document chunks: {exc}")
         return []
 
-    matches = getattr(response, "matches", None)
-    if matches is None and isinstance(response, dict):
-        matches = response.get("matches", [])
-    matches = matches or []
+    matches = [match for response in responses for match in _response_matches(response)]
 
     logger.info("Full document retrieval raw matches", count=len(matches))
 
-    chunks: List[RetrievedChunk] = []
-    for match in matches:
-        metadata = getattr(match, "metadata", None)
-        if metadata is None and isinstance(match, dict):
-            metadata = match.get("metadata", {})
-        metadata = metadata or {}
-        text = metadata.get("text") or metadata.get("chunk") or ""
-        score = getattr(match, "score", None)
-        if score is None and isinstance(match, dict):
-            score = match.get("score")
-        chunks.append(
-            RetrievedChunk(
-                id=getattr(match, "id", None)
-                if not isinstance(match, dict)
-                else match.get("id"),
-                score=_score_from_match(match),
-                text=text,
-                metadata=metadata,
-            )
+    ids, scores, metadatas, texts = _normalize_matches(matches)
+    chunks: List[RetrievedChunk] = [
+        RetrievedChunk(id=chunk_id, score=score, text=text, metadata=metadata)
+        for chunk_id, score, metadata, text in zip(ids, scores.tolist(), metadatas, texts)
+    ]
+    if len(chunks) > max_chunks:
+        # Partitions are uneven, so each may return up to max_chunks; keep the document prefix
+        logger.warning(
+            "Full document exceeds SUMMARY_DOC_MAX_CHUNKS; trimming",
+            fetched=len(chunks),
+            max_chunks=max_chunks,
         )
+        chunks = sorted(chunks, key=document_sort_key)[:max_chunks]
 
     logger.info("Full document retrieval completed", returned=len(chunks))
     return chunks
@@ -295,23 +691,37 @@ def assemble_document_context(
 ) -> Tuple[str, bool]:
     """Join chunk texts into a single document context string."""
 
-    texts: List[str] = []
-    for chunk in chunks:
-        text = (chunk.text or "").strip()
-        if text:
-            texts.append(text)
+    texts: List[str] = [chunk.stripped for chunk in chunks if chunk.stripped]
+    if not max_chars:
+        return "\n\n".join(texts), False
+
+    # Keep whole texts while they fit; only the piece crossing the limit is sliced
+    kept: List[str] = []
+    total = 0
+    for text in texts:
+        separator = 2 if kept else 0
+        if total + separator + len(text) <= max_chars:
+            kept.append(text)
+            total += separator + len(text)
+            continue
 
-    combined = "\n\n".join(texts)
-    if not max_chars or len(combined) <= max_chars:
-        return combined, False
+        remaining = max_chars - total - separator
+        if remaining > 0:
+            piece = text[:remaining]
+            boundary = piece.rfind(" ")
+            if boundary > 0 and len(text) > remaining and not text[remaining].isspace():
+                piece = piece[:boundary]
+            if piece.rstrip():
+                kept.append(piece)
+        truncated_text = "\n\n".join(kept).rstrip()
+        if not truncated_text.endswith("…"):
+            truncated_text += "…"
+        return truncated_text, True
 
-    truncated_text = combined[:max_chars].rstrip()
-    if not truncated_text.endswith("…"):
-        truncated_text += "…"
-    return truncated_text, True
+    return "\n\n".join(kept), False
 
 
-def build_qna_context(chunks: List[RetrievedChunk]) -> Tuple[str, List[Dict[str, Any]]]:
+def build_qna_context(chunks: List[RetrievedChunk]) -> Tuple[str, List[Citation]]:
     """Create a labeled context block and citation map similar to the reference script."""
 
     if not chunks:
@@ -321,38 +731,36 @@ def build_qna_context(chunks: List[RetrievedChunk]) -> Tuple[str, List[Dict[str,
     max_snippet = settings.RAG_MAX_SNIPPET_CHARS
 
     lines: List[str] = []
-    citation_map: List[Dict[str, Any]] = []
+    citation_map: List[Citation] = []
     used_len = 0
 
     for index, chunk in enumerate(chunks, start=1):
-        text = (chunk.text or "").strip()
-        if not text:
+        if not chunk.stripped:
             continue
-        if len(text) > max_snippet:
-            text = text[:max_snippet] + "…"
+        text = chunk.snippet(max_snippet)
 
-        source_file = chunk.metadata.get("source_file")
-        header = f"[CIT:{index}] {source_file or 'unknown_file'}"
-        block = f"{header}\n{text}\n"
+        metadata = chunk.metadata
+        source_file = metadata.get("source_file")
+        block = f"[CIT:{index}] {source_file or 'unknown_file'}\n{text}\n"
 
         if used_len + len(block) > max_context:
             break
 
         lines.append(block)
         citation_map.append(
-            {
-                "label": index,
-                "id": chunk.id,
-                "score": round(chunk.score, 4),
-                "source_file": source_file,
-                "source_url": chunk.metadata.get("source_url"),
-                "page_index": chunk.metadata.get("page_index"),
-                "chunk_index": chunk.metadata.get("chunk_index"),
-                "title": chunk.metadata.get("title"),
-                "court_name": chunk.metadata.get("court_name"),
-                "case_number": chunk.metadata.get("case_number"),
-                "decision_date": chunk.metadata.get("decision_date"),
-            }
+            Citation(
+                label=index,
+                id=chunk.id,
+                score=round(chunk.score, 4),
+                source_file=source_file,
+                source_url=metadata.get("source_url"),
+                page_index=metadata.get("page_index"),
+                chunk_index=metadata.get("chunk_index"),
+                title=metadata.get("title"),
+                court_name=metadata.get("court_name"),
+                case_number=metadata.get("case_number"),
+                decision_date=metadata.get("decision_date"),
+            )
         )
         used_len += len(block)
 
@@ -377,10 +785,9 @@ def build_summary_context(
     used_len = 0
 
     for chunk in chunks:
-        text = (chunk.text or "").strip()
-        if not text:
+        if not chunk.stripped:
             continue
-        snippet = text[:max_snippet] + ("…" if len(text) > max_snippet else "")
+        snippet = chunk.snippet(max_snippet)
         if used_len + len(snippet) > max_chars:
             break
         segments.append(snippet)
@@ -1,15 +1,61 @@
 """
 Service manager for shared service instances
 """
-from typing import Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from typing import Iterator, Optional
 from app.services.gdrive_service import GoogleDriveService
 from app.services.mongodb_service import MongoDBService
 
-# Global Google Drive service instance
-gdrive_service: Optional[GoogleDriveService] = None
 
-# Global MongoDB service instance
-mongodb_service: Optional[MongoDBService] = None
+@dataclass(frozen=True)
+class ServiceRegistry:
+    """Immutable set of shared service instances"""
+    gdrive: Optional[GoogleDriveService] = None
+    mongodb: Optional[MongoDBService] = None
+
+
+# Process-wide registry, filled in at startup. Startup runs in the lifespan task, whose
+# context request tasks don't inherit, so this can't live in the ContextVar itself.
+_default_registry = ServiceRegistry()
+
+# Per-task override (see override_services); None means "use the process-wide registry"
+_SERVICES: ContextVar[Optional[ServiceRegistry]] = ContextVar("services", default=None)
+
+
+def get_service_registry() -> ServiceRegistry:
+    """
+    Get the service registry for the current task
+    
+    Returns:
+        The task's override registry if one is active, else the process-wide registry
+    """
+    return _SERVICES.get() or _default_registry
+
+
+def _update_default_registry(**services) -> None:
+    global _default_registry
+    _default_registry = replace(_default_registry, **services)
+
+
+@contextmanager
+def override_services(**services) -> Iterator[ServiceRegistry]:
+    """
+    Substitute services for the current task (and tasks it spawns), e.g. in tests
+    
+    Args:
+        **services: ServiceRegistry fields to replace (gdrive, mongodb)
+    
+    Yields:
+        The registry in effect inside the block
+    """
+    registry = replace(get_service_registry(), **services)
+    token = _SERVICES.set(registry)
+    try:
+        yield registry
+    finally:
+        _SERVICES.reset(token)
 
 
 def get_gdrive_service() -> GoogleDriveService:
@@ -18,14 +64,14 @@ def get_gdrive_service() -> GoogleDriveService:
     
     Returns:
         GoogleDriveService instance
-        
+    
     Raises:
         RuntimeError: If service is not initialized
     """
-    global gdrive_service
-    if gdrive_service is None:
+    service = get_service_registry().gdrive
+    if service is None:
         raise RuntimeError("Google Drive service is not available")
-    return gdrive_service
+    return service
 
 
 def set_gdrive_service(service: GoogleDriveService) -> None:
@@ -35,24 +81,31 @@ def set_gdrive_service(service: GoogleDriveService) -> None:
     Args:
         service: GoogleDriveService instance to set
     """
-    global gdrive_service
-    gdrive_service = service
+    _update_default_registry(gdrive=service)
 
 
 def get_mongodb_service() -> MongoDBService:
     """
     Get the MongoDB service instance
     
+    Falls back to the process-wide MongoDBService (connecting on first use) when
+    startup did not set one, e.g. because MongoDB was unreachable at the time.
+    
     Returns:
         MongoDBService instance
-        
+    
     Raises:
-        RuntimeError: If service is not initialized
+        RuntimeError: If service is not initialized and cannot be created
     """
-    global mongodb_service
-    if mongodb_service is None:
-        raise RuntimeError("MongoDB service is not available")
-    return mongodb_service
+    service = get_service_registry().mongodb
+    if service is None:
+        try:
+            service = MongoDBService.get_service()
+        except Exception as e:
+            raise RuntimeError("MongoDB service is not available") from e
+        if _SERVICES.get() is None:
+            _update_default_registry(mongodb=service)
+    return service
 
 
 def set_mongodb_service(service: MongoDBService) -> None:
@@ -62,7 +115,4 @@ def set_mongodb_service(service: MongoDBService) -> None:
     Args:
         service: MongoDBService instance to set
     """
-    global mongodb_service
-    mongodb_service = service
-
-
+    _update_default_registry(mongodb=service)
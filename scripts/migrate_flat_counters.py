@@ -0,0 +1,52 @@
+"""
+One-time migration: move nested ocr_jobs counters to flat top-level fields
+
+Renames counters.<name> -> c_<name> and embedding_counters.<name> -> ec_<name> on
+every job document, then removes the emptied subdocuments.
+
+Usage:
+    python -m scripts.migrate_flat_counters
+"""
+from loguru import logger
+
+from app.config import settings
+from app.services.mongodb_service import (
+    COUNTER_PREFIX,
+    EMBEDDING_COUNTER_PREFIX,
+    JOB_COUNTER_FIELDS,
+    JOB_EMBEDDING_COUNTER_FIELDS,
+    get_mongo_client,
+)
+
+
+def migrate():
+    """Rename nested counter fields on all ocr_jobs documents"""
+    client = get_mongo_client()
+    try:
+        jobs = client[settings.MONGODB_DATABASE].ocr_jobs
+        
+        renames = {
+            **{f"counters.{key}": f"{COUNTER_PREFIX}{key}" for key in JOB_COUNTER_FIELDS},
+            **{
+                f"embedding_counters.{key}": f"{EMBEDDING_COUNTER_PREFIX}{key}"
+                for key in JOB_EMBEDDING_COUNTER_FIELDS
+            },
+        }
+        
+        result = jobs.update_many(
+            {"$or": [{"counters": {"$exists": True}}, {"embedding_counters": {"$exists": True}}]},
+            {"$rename": renames}
+        )
+        logger.info(f"Renamed counter fields on {result.modified_count} job(s)")
+        
+        result = jobs.update_many(
+            {"$or": [{"counters": {"$exists": True}}, {"embedding_counters": {"$exists": True}}]},
+            {"$unset": {"counters": "", "embedding_counters": ""}}
+        )
+        logger.info(f"Removed legacy counter subdocuments from {result.modified_count} job(s)")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    migrate()